@@ -37,11 +37,30 @@ import sys
 import json
 import argparse
 import asyncio
+from dataclasses import fields
 from pathlib import Path
 
+import orjson
+from pydantic import BaseModel
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+
+def _orjson_default(obj):
+    """Fallback for types orjson does not encode natively (Pydantic models)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _write_json(obj) -> None:
+    """Encode obj with orjson and write the bytes straight to stdout."""
+    sys.stdout.buffer.write(orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS))
+    sys.stdout.buffer.flush()
+
 
 async def run_tier3_costing(
     application: str,
@@ -61,8 +80,12 @@ async def run_tier3_costing(
 ):
     """Run Tier 1 + Tier 3 economic costing directly (bypassing MCP wrapper)."""
     from tools.heuristic_sizing import heuristic_sizing
-    from tools.watertap_costing import cost_degasser_system_async
-    from dataclasses import asdict
+    from tools.watertap_costing import cost_degasser_system_async, preload_costing_libraries
+
+    # Tier 3 needs the full Tier 1 outcome, but the Pyomo/IDAES/WaterTAP
+    # imports it relies on do not - load them in a worker thread meanwhile.
+    # run_in_executor submits immediately (Tier 1 never yields to the loop).
+    preload_future = asyncio.get_running_loop().run_in_executor(None, preload_costing_libraries)
 
     try:
         # Run Tier 1
@@ -82,48 +105,29 @@ async def run_tier3_costing(
             motor_efficiency=motor_efficiency
         )
 
-        # Convert to dict (recursively for nested dataclasses and Pydantic models)
-        from dataclasses import fields
-        from pydantic import BaseModel
-
-        def convert_to_dict(obj):
-            """Recursively convert dataclasses and Pydantic models to plain dicts/lists."""
-            if isinstance(obj, BaseModel):
-                return {k: convert_to_dict(v) for k, v in obj.model_dump().items()}
-            if hasattr(obj, "__dataclass_fields__"):
-                return {field.name: convert_to_dict(getattr(obj, field.name)) for field in fields(obj)}
-            if isinstance(obj, dict):
-                return {k: convert_to_dict(v) for k, v in obj.items()}
-            if isinstance(obj, (list, tuple, set)):
-                return [convert_to_dict(item) for item in obj]
-            return obj
-
-        result = convert_to_dict(tier1_outcome)
-
         # Run Tier 3
+        await preload_future
         tier3_result = await cost_degasser_system_async(
             tier1_outcome=tier1_outcome,
             tier2_result=None,
             application=application,
             packing_type=packing_type
         )
-        # Convert tier3_result to ensure all nested objects are serializable
-        result['tier3'] = convert_to_dict(tier3_result)
+        # orjson encodes the dataclass fields natively and calls
+        # _orjson_default for the nested Pydantic models
+        result = {f.name: getattr(tier1_outcome, f.name) for f in fields(tier1_outcome)}
+        result['tier3'] = tier3_result
 
-        # Verify conversion worked by forcing a test serialization first
+        # Write result as JSON to stdout (single serialization pass;
+        # diagnostics only on failure)
         try:
-            _ = json.dumps(result)
-        except TypeError as te:
-            # Find the problematic object
-            import sys
-            sys.stderr.write(f"DEBUG: Serialization test failed: {te}\n")
+            _write_json(result)
+        except TypeError as te:  # orjson.JSONEncodeError is a TypeError
+            sys.stderr.write(f"DEBUG: Serialization failed: {te}\n")
             sys.stderr.write(f"DEBUG: Result keys: {result.keys()}\n")
-            if 'tier3' in result:
+            if isinstance(result.get('tier3'), dict):
                 sys.stderr.write(f"DEBUG: Tier3 keys: {result['tier3'].keys()}\n")
             raise
-
-        # Print result as JSON to stdout
-        print(json.dumps(result, indent=2))
         return 0
 
     except Exception as e:
@@ -133,9 +137,14 @@ async def run_tier3_costing(
             "message": f"Tier 3 costing failed: {str(e)}",
             "traceback": traceback.format_exc()
         }
-        print(json.dumps(error_result, indent=2))
+        _write_json(error_result)
         return 1
 
+    finally:
+        # A Tier 1 failure skips the await above; wait for the import thread
+        # here so its exception, if any, is retrieved instead of left pending
+        await asyncio.gather(preload_future, return_exceptions=True)
+
 
 def main():
     """Main CLI entry point."""
@@ -12,8 +12,10 @@ Output:
 """
 
 import json
+import re
 import sqlite3
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Database paths
@@ -23,11 +25,88 @@ HENRYS_DB = DB_DIR / "henrys_law.db"
 VOC_PROPERTIES_JSON = DB_DIR / "voc_properties.json"
 VOC_PHASES_DAT = DB_DIR / "voc_phases.dat"
 
+# Read-only reference DB: no journal/fsync work, large page cache, mmap I/O
+_HENRYS_DB_PRAGMAS = (
+    "PRAGMA query_only=1;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA journal_mode=OFF;",
+)
+
+_henrys_conn = None
+
+# value.json field names (spelling as in the upstream file) -> unified names
+_VALUE_JSON_KEY_MAP = {
+    "name": "Contamenat ",
+    "formula": "Chemical formula ",
+    "molecular_weight": "Molculer weight (g/mol)",
+    "atomic_volume": "Aatomic Volume",
+    "henry_enthalpy": "delta_H",
+    "henry_constant_25C": "K",
+    "boiling_point_raw": "Boilling temp.",
+    "diffusion_volume": "Diffusion volume",
+}
+
+# Numeric part of boiling point strings such as "87.2°C"
+_BP_RE = re.compile(r'([\d.]+)')
+
+
+@lru_cache(maxsize=1)
+def _load_value_json_cached(mtime):
+    """Parse value.json; cache entry is keyed on the file's mtime."""
+    return json.loads(VALUE_JSON.read_bytes())
+
 
 def load_value_json():
-    """Load VOC data from value.json."""
-    with open(VALUE_JSON, 'r') as f:
-        return json.load(f)
+    """Load VOC data from value.json (re-parsed only when the file changes)."""
+    return _load_value_json_cached(VALUE_JSON.stat().st_mtime)
+
+
+def get_henrys_db_connection():
+    """
+    Return the shared read-only connection to henrys_law.db.
+
+    Opened lazily on first use and reused for the rest of the process.
+    Returns None if the database file is missing.
+    """
+    global _henrys_conn
+    if _henrys_conn is None:
+        if not HENRYS_DB.exists():
+            return None
+        conn = sqlite3.connect(f"file:{HENRYS_DB.as_posix()}?mode=ro&cache=shared", uri=True)
+        for pragma in _HENRYS_DB_PRAGMAS:
+            conn.execute(pragma)
+        _henrys_conn = conn
+    return _henrys_conn
+
+
+def _fetch_table_schema(cursor):
+    """
+    Fetch every table's columns in a single statement.
+
+    Returns: dict mapping table name -> list of (column_name, column_type)
+    """
+    cursor.execute(
+        "SELECT m.name, p.name, p.type "
+        "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+        "WHERE m.type = 'table' ORDER BY m.name, p.cid;"
+    )
+    schema = {}
+    for table_name, column_name, column_type in cursor.fetchall():
+        schema.setdefault(table_name, []).append((column_name, column_type))
+    return schema
+
+
+def _fetch_row_counts(cursor, table_names):
+    """Count rows of all tables with one UNION ALL query."""
+    if not table_names:
+        return {}
+    query = " UNION ALL ".join(
+        f"SELECT ? AS t, COUNT(*) FROM \"{name}\"" for name in table_names
+    )
+    cursor.execute(query, list(table_names))
+    return dict(cursor.fetchall())
 
 
 def query_henrys_law_db(compound_name=None, cas_number=None):
@@ -36,24 +115,44 @@ def query_henrys_law_db(compound_name=None, cas_number=None):
 
     Returns: dict with Henry's constant data including temperature dependence
     """
-    if not HENRYS_DB.exists():
+    conn = get_henrys_db_connection()
+    if conn is None:
         print(f"Warning: Henry's law database not found at {HENRYS_DB}")
         return {}
 
-    conn = sqlite3.connect(HENRYS_DB)
     cursor = conn.cursor()
 
     # Get table structure first
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = cursor.fetchall()
-    print(f"Available tables: {tables}")
+    schema = _fetch_table_schema(cursor)
+    print(f"Available tables: {list(schema)}")
 
     # For now, return empty dict until we explore the schema
     # TODO: Implement proper query logic once schema is understood
-    conn.close()
     return {}
 
 
+def _parse_boiling_point(boiling_point_raw):
+    """Extract the numeric °C value from a boiling point string (None if absent)."""
+    if not boiling_point_raw:
+        return None
+    bp_match = _BP_RE.search(boiling_point_raw)
+    if bp_match:
+        try:
+            return float(bp_match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+def _normalize_value_json_entry(data):
+    """Map one value.json entry onto unified field names, stripping strings."""
+    normalized = {}
+    for target, source in _VALUE_JSON_KEY_MAP.items():
+        value = data.get(source)
+        normalized[target] = value.strip() if isinstance(value, str) else value
+    return normalized
+
+
 def create_unified_voc_properties():
     """
     Create unified VOC properties database.
@@ -77,9 +176,6 @@ def create_unified_voc_properties():
     # Load existing data
     value_data = load_value_json()
 
-    # Initialize unified database
-    unified_db = {}
-
     # Process value.json entries
     # Note: value.json doesn't have CAS numbers, so we'll use compound names as keys for now
     # TODO: Add CAS number mapping
@@ -89,35 +185,22 @@ def create_unified_voc_properties():
         "CCL4": "56-23-5"  # Carbon tetrachloride
     }
 
-    import re
-
-    for compound_key, data in value_data.items():
-        cas = cas_mapping.get(compound_key, f"UNKNOWN_{compound_key}")
-
-        # Clean boiling point - extract numeric value only
-        boiling_point_raw = data.get("Boilling temp.", "")
-        boiling_point_c = None
-        if boiling_point_raw:
-            # Extract just the numeric value
-            bp_match = re.search(r'([\d.]+)', boiling_point_raw)
-            if bp_match:
-                try:
-                    boiling_point_c = float(bp_match.group(1))
-                except ValueError:
-                    boiling_point_c = None
-
-        unified_db[cas] = {
-            "name": data.get("Contamenat ", "").strip(),
+    normalized = {key: _normalize_value_json_entry(data) for key, data in value_data.items()}
+    unified_db = {
+        cas_mapping.get(compound_key, f"UNKNOWN_{compound_key}"): {
+            "name": entry["name"] or "",
             "common_names": [compound_key],
-            "formula": data.get("Chemical formula ", "").strip(),
-            "molecular_weight": data.get("Molculer weight (g/mol)", None),
-            "henry_constant_25C": data.get("K", None),  # Dimensionless H
-            "henry_enthalpy": data.get("delta_H", None),  # J/mol
-            "boiling_point_c": boiling_point_c,  # Numeric °C
-            "diffusion_volume": data.get("Diffusion volume", None),
-            "atomic_volume": data.get("Aatomic Volume", None),
+            "formula": entry["formula"] or "",
+            "molecular_weight": entry["molecular_weight"],
+            "henry_constant_25C": entry["henry_constant_25C"],  # Dimensionless H
+            "henry_enthalpy": entry["henry_enthalpy"],  # J/mol
+            "boiling_point_c": _parse_boiling_point(entry["boiling_point_raw"]),  # Numeric °C
+            "diffusion_volume": entry["diffusion_volume"],
+            "atomic_volume": entry["atomic_volume"],
             "sources": ["value.json"]
         }
+        for compound_key, entry in normalized.items()
+    }
 
     # TODO: Query henrys_law.db for additional compounds and temperature data
     # henrys_data = query_henrys_law_db()
@@ -156,9 +239,9 @@ def generate_phreeqc_phases(voc_db):
                     A = log10(K_ref) - B / T_ref
     """
 
-    import math
+    import numpy as np
 
-    phases_content = """# PHREEQC PHASES definitions for VOC stripping
+    parts = ["""# PHREEQC PHASES definitions for VOC stripping
 # Generated from unified VOC properties database
 #
 # Henry's law: Cgas = H * Caq (dimensionless form)
@@ -174,56 +257,60 @@ def generate_phreeqc_phases(voc_db):
 # Reference: phreeqc.dat CO2(g) format
 
 PHASES
-"""
+"""]
 
     R_SI = 8.314  # J/(mol·K)
     R_atm = 0.08206  # L·atm/(mol·K) for pressure calculation
     T_ref = 298.15  # 25°C in Kelvin
 
-    for cas, props in voc_db.items():
-        formula = props.get("formula", "")
-        name = props.get("common_names", [""])[0]
-        H_25C = props.get("henry_constant_25C")  # dimensionless Cgas/Caq
-        delta_H = props.get("henry_enthalpy")  # J/mol
-
-        if not H_25C or not formula:
-            continue
-
-        # Calculate PHREEQC equilibrium constant
-        # PHREEQC equilibrium: aq_species = gas_phase
-        # K = P_gas / activity_aq = 1 / (Hcc * R * T)
-        # where Hcc is dimensionless (Caq/Cgas), so our H (Cgas/Caq) = 1/Hcc
-        # Therefore: K = H * R * T, but PHREEQC uses -log_k = log10(K)
-        # Wait, checking phreeqc.dat format: CO2(g) uses -log_k for the value
-        # So we need: -log_k <negative value> to get correct equilibrium
-        K_25C = 1.0 / (H_25C * R_atm * T_ref)  # K = 1 / (H * R * T)
-        log_k_25C = math.log10(K_25C)
-
-        phases_content += f"\n  {name}(g)\n"
-        phases_content += f"  {formula} = {formula}\n"
-        phases_content += f"  -log_k {log_k_25C:.6f}  # From H = {H_25C} (dimensionless) at 25°C\n"
+    # Only compounds with both a Henry's constant and a formula get a phase
+    entries = [
+        (cas, props.get("common_names", [""])[0], props.get("formula", ""),
+         props.get("henry_constant_25C"), props.get("henry_enthalpy"))
+        for cas, props in voc_db.items()
+        if props.get("henry_constant_25C") and props.get("formula", "")
+    ]
+    H_25C_arr = np.array([e[3] for e in entries], dtype=float)  # dimensionless Cgas/Caq
+    delta_H_arr = np.array([e[4] or np.nan for e in entries], dtype=float)  # J/mol
+
+    # Calculate PHREEQC equilibrium constants for all compounds at once
+    # PHREEQC equilibrium: aq_species = gas_phase
+    # K = P_gas / activity_aq = 1 / (Hcc * R * T)
+    # where Hcc is dimensionless (Caq/Cgas), so our H (Cgas/Caq) = 1/Hcc
+    # Therefore: K = H * R * T, but PHREEQC uses -log_k = log10(K)
+    # Wait, checking phreeqc.dat format: CO2(g) uses -log_k for the value
+    # So we need: -log_k <negative value> to get correct equilibrium
+    K_25C_arr = 1.0 / (H_25C_arr * R_atm * T_ref)  # K = 1 / (H * R * T)
+    log_k_25C_arr = np.log10(K_25C_arr)
+
+    # PHREEQC -analytic format: log10(K) = A + B/T + C*log10(T) + D*T + E/T^2
+    # Van't Hoff: log10(K(T)) = log10(K_ref) - ΔH/(2.303*R) * (1/T - 1/T_ref)
+    # Rearrange: log10(K(T)) = [log10(K_ref) + ΔH/(2.303*R*T_ref)] + [-ΔH/(2.303*R)] / T
+    # So: A = log10(K_ref) + ΔH/(2.303*R*T_ref), B = -ΔH/(2.303*R)
+    # (NaN where no enthalpy is available; those rows skip -analytic)
+    B_arr = -delta_H_arr / (2.303 * R_SI)
+    A_arr = log_k_25C_arr - B_arr / T_ref
+
+    for (cas, name, formula, H_25C, delta_H), log_k_25C, A, B in zip(
+        entries, log_k_25C_arr.tolist(), A_arr.tolist(), B_arr.tolist()
+    ):
+        parts.append(f"\n  {name}(g)\n")
+        parts.append(f"  {formula} = {formula}\n")
+        parts.append(f"  -log_k {log_k_25C:.6f}  # From H = {H_25C} (dimensionless) at 25°C\n")
 
         # Add temperature dependence if enthalpy available
         if delta_H:
-            # PHREEQC -analytic format: log10(K) = A + B/T + C*log10(T) + D*T + E/T^2
-            # Van't Hoff: log10(K(T)) = log10(K_ref) - ΔH/(2.303*R) * (1/T - 1/T_ref)
-            # Rearrange: log10(K(T)) = [log10(K_ref) + ΔH/(2.303*R*T_ref)] + [-ΔH/(2.303*R)] / T
-            # So: A = log10(K_ref) + ΔH/(2.303*R*T_ref), B = -ΔH/(2.303*R)
-
-            B = -delta_H / (2.303 * R_SI)
-            A = log_k_25C - B / T_ref
+            parts.append(f"  -analytic {A:.6f} {B:.6f} 0 0 0\n")
+            parts.append(f"  # ΔH = {delta_H} J/mol for temperature correction\n")
+            parts.append(f"  # Van't Hoff: log10(K) = {A:.6f} + {B:.6f}/T\n")
 
-            phases_content += f"  -analytic {A:.6f} {B:.6f} 0 0 0\n"
-            phases_content += f"  # ΔH = {delta_H} J/mol for temperature correction\n"
-            phases_content += f"  # Van't Hoff: log10(K) = {A:.6f} + {B:.6f}/T\n"
+        parts.append(f"  # CAS: {cas}\n")
 
-        phases_content += f"  # CAS: {cas}\n"
-
-    phases_content += "\nEND\n"
+    parts.append("\nEND\n")
 
     # Save PHREEQC phases file with UTF-8 encoding
     with open(VOC_PHASES_DAT, 'w', encoding='utf-8') as f:
-        f.write(phases_content)
+        f.write("".join(parts))
 
     print(f"Generated PHREEQC phases file: {VOC_PHASES_DAT}")
 
@@ -232,38 +319,32 @@ PHASES
 
 def explore_henrys_db():
     """Explore Henry's law database schema."""
-    if not HENRYS_DB.exists():
+    conn = get_henrys_db_connection()
+    if conn is None:
         print(f"Henry's law database not found at {HENRYS_DB}")
         return
 
-    conn = sqlite3.connect(HENRYS_DB)
     cursor = conn.cursor()
 
     print("\n=== Henry's Law Database Schema ===\n")
 
-    # Get all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = cursor.fetchall()
+    # Columns and row counts for all tables in two statements
+    schema = _fetch_table_schema(cursor)
+    counts = _fetch_row_counts(cursor, list(schema))
 
-    for (table_name,) in tables:
+    for table_name, columns in schema.items():
         print(f"\nTable: {table_name}")
 
-        # Get column info
-        cursor.execute(f"PRAGMA table_info({table_name});")
-        columns = cursor.fetchall()
-
         print(f"  Columns:")
-        for col in columns:
-            print(f"    - {col[1]} ({col[2]})")
+        for column_name, column_type in columns:
+            print(f"    - {column_name} ({column_type})")
 
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-        count = cursor.fetchone()[0]
+        count = counts[table_name]
         print(f"  Rows: {count}")
 
         # Show sample data (first 3 rows)
         if count > 0:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 3;")
+            cursor.execute(f"SELECT * FROM \"{table_name}\" LIMIT 3;")
             samples = cursor.fetchall()
             print(f"  Sample data:")
             for row in samples[:3]:
@@ -272,8 +353,6 @@ def explore_henrys_db():
                 except UnicodeEncodeError:
                     print(f"    [Row with special characters - skipped for display]")
 
-    conn.close()
-
 
 if __name__ == "__main__":
     print("=== VOC Database Generation ===\n")
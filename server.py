@@ -14,47 +14,112 @@ Applications:
 Author: Claude AI
 """
 
-import json
+import asyncio
+import atexit
+import contextvars
+import importlib
+import importlib.util
+import inspect
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 import uuid
 import warnings
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Import job management utilities
 from utils.job_manager import JobManager
 from utils.path_utils import get_python_executable
 
+# Interpreter for job subprocesses; fixed for the server's lifetime
+_PYTHON_EXE = get_python_executable()
+
+# Log output (debug.log and stderr) is written by a listener thread so tool
+# calls never block on disk or on a slow stderr reader. The QueueHandler
+# formats each record before enqueueing it, so the handlers behind the
+# listener write the finished line as-is.
+_log_queue = queue.SimpleQueue()
+
+
+class _BurstFlushFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    debug.log handler that flushes once per burst instead of once per record.
+
+    Records reach it only from the listener thread, so the file buffer is
+    flushed whenever that thread has drained the queue; nothing stays
+    unwritten while the server is idle.
+    """
+
+    def flush(self):
+        if _log_queue.empty():
+            super().flush()
+
+
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    _BurstFlushFileHandler('debug.log', maxBytes=10_000_000, backupCount=3),
+    logging.StreamHandler(sys.stderr),  # Explicit stderr to avoid stdout pollution
+    respect_handler_level=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Configure logging - CRITICAL: Use INFO level and stderr-only to prevent stdout pollution
 # Pyomo/IDAES DEBUG spam breaks MCP's JSON-RPC transport over stdio
+# LOG_LEVEL (e.g. DEBUG, WARNING) overrides the INFO default
+_LOG_LEVEL = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+if not isinstance(_LOG_LEVEL, int):
+    _LOG_LEVEL = logging.INFO
+# True while batch_heuristic_sizing_mcp runs a sweep: per-point Tier 1 INFO
+# lines are dropped before formatting (warnings still pass) and the sweep
+# logs one summary instead. Context-local, so job threads are unaffected.
+_quiet_sweep = contextvars.ContextVar("quiet_sweep", default=False)
+
+
+def _sweep_log_filter(record: logging.LogRecord) -> bool:
+    return record.levelno >= logging.WARNING or not _quiet_sweep.get()
+
+
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+_log_handler.addFilter(_sweep_log_filter)
 logging.basicConfig(
-    level=logging.INFO,
+    level=_LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('debug.log'),
-        logging.StreamHandler(sys.stderr)  # Explicit stderr to avoid stdout pollution
-    ]
+    handlers=[_log_handler]
 )
 logger = logging.getLogger("degasser-design-mcp")
 
-# Suppress noisy library DEBUG/INFO logs that leak to stderr and corrupt MCP transport
-noisy_libraries = ["pyomo", "pyomo.core", "pyomo.common", "pyomo.environ",
-                   "idaes", "idaes.core", "watertap", "qsdsan", "qsd"]
-for lib_name in noisy_libraries:
-    lib_logger = logging.getLogger(lib_name)
-    lib_logger.setLevel(logging.WARNING)
-    lib_logger.propagate = False
-
-# CRITICAL: Suppress pint.util deprecation warnings that bypass redirect_stderr()
-# These warnings come from Pyomo's use of pint and break MCP's JSON-RPC transport
-for pint_logger_name in ("pint", "pint.util", "pint.registry"):
-    pint_logger = logging.getLogger(pint_logger_name)
-    pint_logger.setLevel(logging.ERROR)  # Only errors, no warnings
-    pint_logger.propagate = False
-    if not pint_logger.handlers:
-        pint_logger.addHandler(logging.NullHandler())
+# Suppress noisy library logs that leak to stderr and corrupt MCP transport.
+# name -> (minimum level, attach NullHandler)
+# pint: CRITICAL - suppress pint.util deprecation warnings that bypass
+# redirect_stderr(); they come from Pyomo's use of pint
+_QUIET_LOGGERS = {
+    **dict.fromkeys(("pyomo", "pyomo.core", "pyomo.common", "pyomo.environ",
+                     "idaes", "idaes.core", "watertap", "qsdsan", "qsd"),
+                    (logging.WARNING, False)),
+    **dict.fromkeys(("pint", "pint.util", "pint.registry"), (logging.ERROR, True)),
+}
+for _name, (_level, _null_handler) in _QUIET_LOGGERS.items():
+    _lib_logger = logging.getLogger(_name)
+    _lib_logger.setLevel(_level)
+    _lib_logger.propagate = False
+    if _null_handler and not _lib_logger.handlers:
+        _lib_logger.addHandler(logging.NullHandler())
+
+# Unless DEBUG was asked for, drop DEBUG records process-wide in one switch
+# so logger.debug() calls return before building a record
+if _LOG_LEVEL > logging.DEBUG:
+    logging.disable(logging.DEBUG)
 
 # Also suppress pint warnings at the warnings module level (belt-and-suspenders)
 warnings.filterwarnings(
@@ -66,77 +131,190 @@ warnings.filterwarnings(
 # Initialize the MCP server
 mcp = FastMCP("degasser-design-calculator")
 
+
+def _max_concurrent_jobs() -> int:
+    """
+    Tier 2/3 jobs allowed to run at once.
+
+    Defaults to the vendored JobManager's 3, capped at the core count (each
+    job holds a PHREEQC or solver session, so more only oversubscribes the
+    CPU). DEGASSER_MAX_CONCURRENT overrides it; an unparsable value falls
+    back to the default and anything below 1 is raised to 1.
+    """
+    default = min(os.cpu_count() or 1, 3)
+    raw = os.environ.get("DEGASSER_MAX_CONCURRENT")
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Ignoring DEGASSER_MAX_CONCURRENT=%r (not an integer); using %d", raw, default
+        )
+        return default
+    if value < 1:
+        logger.warning("DEGASSER_MAX_CONCURRENT=%d is below 1; using 1", value)
+        return 1
+    return value
+
+
+_MAX_CONCURRENT_JOBS = _max_concurrent_jobs()
+
+
+@lru_cache(maxsize=1)
+def _job_manager() -> JobManager:
+    """Shared JobManager, created on first use (loads jobs/, installs signal handlers)."""
+    return JobManager(max_concurrent_jobs=_MAX_CONCURRENT_JOBS)
+
+
 # Import core tools
 # Phase 1: Tier 1 Heuristic Sizing (COMPLETE)
 from tools.heuristic_sizing import heuristic_sizing, list_available_packings
+from tools.schemas import Tier1Inputs, Tier1Outcome
 
 # Phase 2: Tier 2 PHREEQC Gas-Liquid Equilibrium (COMPLETE)
-from tools.simulation_sizing import staged_column_simulation
-
 # Phase 3: Tier 3 WaterTAP Economic Costing (COMPLETE)
-from tools.watertap_costing import cost_degasser_system_async
+# tools.simulation_sizing / tools.watertap_costing are not imported here:
+# Tier 2/3 run as background jobs (utils/tier2_cli.py, utils/tier3_cli.py),
+# so PhreeqPython and Pyomo/IDAES/WaterTAP stay out of server start-up.
 
 # Phase 4: Report Generation & Batch Optimization (TO BE IMPLEMENTED)
 # from tools.report_generator import generate_degasser_report
 # from tools.batch_optimization import batch_optimize_degasser
 
-# Create wrapper for heuristic_sizing that returns dict for MCP
-from dataclasses import asdict, fields
-from pydantic import BaseModel
-
-
-def convert_to_dict(obj):
-    """Recursively convert dataclasses and Pydantic models to dicts."""
-    if isinstance(obj, BaseModel):
-        return obj.model_dump()
-    elif hasattr(obj, '__dataclass_fields__'):
-        result = {}
-        for field in fields(obj):
-            value = getattr(obj, field.name)
-            result[field.name] = convert_to_dict(value)
-        return result
-    elif isinstance(obj, list):
-        return [convert_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: convert_to_dict(v) for k, v in obj.items()}
+# Tier 1 outcomes keyed on the full argument set (Tier1Inputs, defaults applied);
+# clients often retry or re-ask identical sizings. The outcome itself is never
+# handed out: every hit builds a fresh response dict, so a caller (or the
+# serialization layer) mutating its reply cannot change later hits.
+_TIER1_CACHE_SIZE = 256
+_tier1_cache: "OrderedDict[Tier1Inputs, Tier1Outcome]" = OrderedDict()
+
+
+async def _cached_tier1(inputs: Tier1Inputs) -> dict:
+    """Run heuristic_sizing (memoized, LRU) and return a new dict of its outcome."""
+    outcome = _tier1_cache.get(inputs)
+    if outcome is not None:
+        _tier1_cache.move_to_end(inputs)
     else:
-        return obj
+        outcome = await heuristic_sizing(**inputs.as_kwargs())
+        _tier1_cache[inputs] = outcome
+        if len(_tier1_cache) > _TIER1_CACHE_SIZE:
+            _tier1_cache.popitem(last=False)
 
+    # Convert Tier1Outcome dataclass to dictionary for MCP serialization
+    # Note: asdict() doesn't handle nested Pydantic models, so use to_dict()
+    return outcome.to_dict()
 
-async def heuristic_sizing_mcp(
-    application: str,
-    water_flow_rate_m3_h: float,
-    inlet_concentration_mg_L: float,
-    outlet_concentration_mg_L: float,
-    air_water_ratio: float = 30.0,
-    temperature_c: float = 25.0,
-    packing_id: str = None,
-    henry_constant_25C: float = None,
-    water_ph: float = None,
-    water_chemistry_json: str = None,
-    include_blower_sizing: bool = True,
-    blower_efficiency_override: float = None,
-    motor_efficiency: float = 0.92
-):
+
+async def heuristic_sizing_mcp(**kwargs):
     """MCP wrapper for heuristic_sizing that returns dictionary."""
-    result = await heuristic_sizing(
-        application=application,
-        water_flow_rate_m3_h=water_flow_rate_m3_h,
-        inlet_concentration_mg_L=inlet_concentration_mg_L,
-        outlet_concentration_mg_L=outlet_concentration_mg_L,
-        air_water_ratio=air_water_ratio,
-        temperature_c=temperature_c,
-        packing_id=packing_id,
-        henry_constant_25C=henry_constant_25C,
-        water_ph=water_ph,
-        water_chemistry_json=water_chemistry_json,
-        include_blower_sizing=include_blower_sizing,
-        blower_efficiency_override=blower_efficiency_override,
-        motor_efficiency=motor_efficiency
-    )
-    # Convert Tier1Outcome dataclass to dictionary for MCP serialization
-    # Note: asdict() doesn't handle nested Pydantic models, so use convert_to_dict
-    return convert_to_dict(result)
+    return await _cached_tier1(Tier1Inputs(**kwargs))
+
+
+# FastMCP builds the tool schema from this signature (return type left off,
+# the wrapper returns a plain dict)
+heuristic_sizing_mcp.__signature__ = inspect.signature(heuristic_sizing).replace(
+    return_annotation=inspect.Signature.empty
+)
+
+# Background job runners: tier -> (module, coroutine function taking job_dir)
+_TIER_RUNNERS = {
+    "tier2": ("utils.tier2_cli", "run_tier2_simulation"),
+    "tier3": ("utils.tier3_cli", "run_tier3_costing"),
+}
+
+# Jobs run in a fresh interpreter by default, isolating crashes, native
+# stdout writes and termination from the STDIO server; each one pays the cold
+# Pyomo/WaterTAP import. DEGASSER_JOB_MODE=in_process opts into running them on
+# worker threads here (imports stay resident between jobs, but a job cannot be
+# terminated and Tier 3 jobs run one at a time).
+_JOB_MODES = ("subprocess", "in_process")
+
+
+def _job_mode() -> str:
+    """
+    How Tier 2/3 jobs run: "subprocess" (default) or "in_process".
+
+    DEGASSER_JOB_MODE selects the mode; any other value is logged and falls
+    back to subprocess, so a typo never moves jobs into the server process.
+    """
+    raw = os.environ.get("DEGASSER_JOB_MODE")
+    if raw is None:
+        return "subprocess"
+    if raw not in _JOB_MODES:
+        logger.warning(
+            "Ignoring DEGASSER_JOB_MODE=%r (expected one of %s); using subprocess",
+            raw, ", ".join(_JOB_MODES)
+        )
+        return "subprocess"
+    return raw
+
+
+_JOB_MODE = _job_mode()
+
+# Runner scripts for subprocess jobs, resolved once against this file so
+# they are found whatever directory the server was started from
+_TIER_SCRIPTS = {
+    tier: str(Path(__file__).resolve().parent / "utils" / f"{tier}_cli.py")
+    for tier in _TIER_RUNNERS
+}
+
+
+async def _start_tier_job(tier: str, params: dict) -> str:
+    """Create the job directory, write params.json and start the tier runner."""
+    manager = _job_manager()
+    job_id = uuid.uuid4().hex[:8]
+    # JobManager creates the jobs/ root once; only the fresh leaf is made here
+    job_dir = manager.jobs_dir / job_id
+    os.mkdir(job_dir)
+
+    # Write params to job directory
+    (job_dir / "params.json").write_bytes(orjson.dumps(params, option=orjson.OPT_INDENT_2))
+
+    # Start background job
+    if _JOB_MODE == "in_process":
+        module_name, func_name = _TIER_RUNNERS[tier]
+        runner = getattr(importlib.import_module(module_name), func_name)
+        # params handed over in memory; params.json stays as the job record
+        # Pyomo/IDAES model building is not thread-safe: one Tier 3 job at a time
+        job = await manager.execute_async(
+            runner, job_dir, job_id=job_id,
+            serial_key="tier3" if tier == "tier3" else None,
+            params=params
+        )
+    else:
+        cmd = [_PYTHON_EXE, _TIER_SCRIPTS[tier], "--job-dir", str(job_dir)]
+        job = await manager.execute(cmd=cmd, cwd=".", job_id=job_id)
+
+    # Register state patch for auto-hydration
+    job["state_patch"] = {
+        "field": f"{tier}_results",
+        "result_file": f"{tier}_results.json"
+    }
+    await manager._save_job_metadata_async(job)
+
+    return job_id
+
+
+# combined_simulation_mcp replies for started jobs; only job_id varies
+# (the None placeholder keeps it second in the reply)
+_JOB_STARTED_RESPONSES = {
+    "tier3": MappingProxyType({
+        "status": "job_started",
+        "job_id": None,
+        "tier": "tier3",
+        "message": "Tier 3 economic costing job started. Use get_job_status(job_id) to check progress.",
+        "estimated_time_seconds": 30
+    }),
+    "tier2": MappingProxyType({
+        "status": "job_started",
+        "job_id": None,
+        "tier": "tier2",
+        "message": "Tier 2 PHREEQC simulation job started. Use get_job_status(job_id) to check progress.",
+        "estimated_time_seconds": 20
+    }),
+}
+
 
 # Create combined tool for Tier 1 + optional Tier 2 + optional Tier 3
 async def combined_simulation_mcp(
@@ -203,118 +381,61 @@ async def combined_simulation_mcp(
     # Remove None values
     params = {k: v for k, v in params.items() if v is not None}
 
-    # If Tier 3 requested, spawn background job (highest tier takes precedence)
-    if run_tier3:
-        manager = JobManager()
-        job_id = str(uuid.uuid4())[:8]
-        job_dir = Path("jobs") / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write params to job directory
-        with open(job_dir / "params.json", "w") as f:
-            json.dump(params, f, indent=2)
+    # If Tier 2/3 requested, spawn background job (highest tier takes precedence)
+    tier = "tier3" if run_tier3 else "tier2" if run_tier2 else None
+    if tier is not None:
+        job_id = await _start_tier_job(tier, params)
+        logger.info(f"Started {tier} background job: {job_id}")
+        return {**_JOB_STARTED_RESPONSES[tier], "job_id": job_id}
 
-        # Build command for tier3_cli.py
-        python_exe = get_python_executable()
-        cmd = [python_exe, "utils/tier3_cli.py", "--job-dir", str(job_dir)]
-
-        # Start background job
-        job = await manager.execute(cmd=cmd, cwd=".", job_id=job_id)
+    # Tier 1 only - run synchronously (fast, <1 sec)
+    return await _cached_tier1(Tier1Inputs(
+        **{name: params[name] for name in Tier1Inputs.__slots__ if name in params}
+    ))
 
-        # Register state patch for auto-hydration
-        job["state_patch"] = {
-            "field": "tier3_results",
-            "result_file": "tier3_results.json"
-        }
-        manager._save_job_metadata(job)
-
-        logger.info(f"Started Tier 3 background job: {job_id}")
-
-        return {
-            "status": "job_started",
-            "job_id": job_id,
-            "tier": "tier3",
-            "message": "Tier 3 economic costing job started. Use get_job_status(job_id) to check progress.",
-            "estimated_time_seconds": 30
-        }
-
-    # If Tier 2 requested, spawn background job
-    if run_tier2:
-        manager = JobManager()
-        job_id = str(uuid.uuid4())[:8]
-        job_dir = Path("jobs") / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write params to job directory
-        with open(job_dir / "params.json", "w") as f:
-            json.dump(params, f, indent=2)
-
-        # Build command for tier2_cli.py
-        python_exe = get_python_executable()
-        cmd = [python_exe, "utils/tier2_cli.py", "--job-dir", str(job_dir)]
-
-        # Start background job
-        job = await manager.execute(cmd=cmd, cwd=".", job_id=job_id)
 
-        # Register state patch for auto-hydration
-        job["state_patch"] = {
-            "field": "tier2_results",
-            "result_file": "tier2_results.json"
-        }
-        manager._save_job_metadata(job)
+async def batch_heuristic_sizing_mcp(sweeps: list[dict]) -> list[dict]:
+    """
+    Run Tier 1 heuristic sizing for a list of operating points in one call.
 
-        logger.info(f"Started Tier 2 background job: {job_id}")
+    Each entry takes the same arguments as heuristic_sizing. Points go
+    through the shared Tier 1 cache, so repeated points cost nothing. A
+    point that fails validation gets {"status": "error", "message": ...}
+    in its slot instead of failing the whole sweep. Per-point INFO logging
+    is replaced by a single summary line (warnings are still logged).
 
-        return {
-            "status": "job_started",
-            "job_id": job_id,
-            "tier": "tier2",
-            "message": "Tier 2 PHREEQC simulation job started. Use get_job_status(job_id) to check progress.",
-            "estimated_time_seconds": 20
-        }
+    Args:
+        sweeps: List of heuristic_sizing argument dicts, e.g.
+            [{"application": "VOC", "water_flow_rate_m3_h": 100,
+              "inlet_concentration_mg_L": 1.0, "outlet_concentration_mg_L": 0.005,
+              "air_water_ratio": 20}, ...]
 
-    # Tier 1 only - run synchronously (fast, <1 sec)
-    tier1_outcome = await heuristic_sizing(
-        application=application,
-        water_flow_rate_m3_h=water_flow_rate_m3_h,
-        inlet_concentration_mg_L=inlet_concentration_mg_L,
-        outlet_concentration_mg_L=outlet_concentration_mg_L,
-        air_water_ratio=air_water_ratio,
-        temperature_c=temperature_c,
-        packing_id=packing_id,
-        henry_constant_25C=henry_constant_25C,
-        water_ph=water_ph,
-        water_chemistry_json=water_chemistry_json,
-        include_blower_sizing=include_blower_sizing,
-        blower_efficiency_override=blower_efficiency_override,
-        motor_efficiency=motor_efficiency
-    )
-
-    # Convert to dictionary (handle Pydantic BaseModel objects)
-    def convert_to_dict(obj):
-        """Recursively convert dataclasses and Pydantic models to dicts."""
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
-        elif hasattr(obj, '__dataclass_fields__'):
-            from dataclasses import fields
-            result = {}
-            for field in fields(obj):
-                value = getattr(obj, field.name)
-                result[field.name] = convert_to_dict(value)
-            return result
-        elif isinstance(obj, list):
-            return [convert_to_dict(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: convert_to_dict(v) for k, v in obj.items()}
-        else:
-            return obj
+    Returns:
+        List of Tier 1 result dicts (or error dicts), in input order
+    """
+    results = []
+    errors = 0
+    token = _quiet_sweep.set(True)
+    try:
+        for point in sweeps:
+            try:
+                results.append(await _cached_tier1(Tier1Inputs(**point)))
+            except (TypeError, ValueError) as e:
+                results.append({"status": "error", "message": str(e)})
+                errors += 1
+    finally:
+        _quiet_sweep.reset(token)
+    logger.info("Tier 1 sweep complete: %d points, %d errors", len(sweeps), errors)
+    return results
 
-    return convert_to_dict(tier1_outcome)
 
 # Register tools
 # Tool 1: Fast Perry's-based heuristic sizing
 mcp.tool()(heuristic_sizing_mcp)
 
+# Tool 1b: Tier 1 parameter sweeps in one call
+mcp.tool()(batch_heuristic_sizing_mcp)
+
 # Tool 2: List available packing catalog
 mcp.tool()(list_available_packings)
 
@@ -345,7 +466,7 @@ async def get_job_status(job_id: str) -> dict:
         Dict with job_id, status (starting/running/completed/failed),
         elapsed_time_seconds, and progress hints if available.
     """
-    manager = JobManager()
+    manager = _job_manager()
     return await manager.get_status(job_id)
 
 
@@ -362,7 +483,7 @@ async def get_job_results(job_id: str) -> dict:
         Dict with job_id, status, total_time_seconds, and results
         (full Tier 1 + Tier 2/3 output).
     """
-    manager = JobManager()
+    manager = _job_manager()
     return await manager.get_results(job_id)
 
 
@@ -377,7 +498,7 @@ async def list_jobs(status_filter: str = None, limit: int = 20) -> dict:
     Returns:
         Dict with jobs list, total count, and concurrency info.
     """
-    manager = JobManager()
+    manager = _job_manager()
     return await manager.list_jobs(status_filter, limit)
 
 
@@ -391,7 +512,7 @@ async def terminate_job(job_id: str) -> dict:
     Returns:
         Dict with termination status.
     """
-    manager = JobManager()
+    manager = _job_manager()
     return await manager.terminate_job(job_id)
 
 
@@ -403,25 +524,29 @@ async def wait_for_job(
     """
     Wait for a background job to complete.
 
-    This is a blocking convenience tool that polls get_job_status until
-    the job completes, fails, or times out. Use this instead of manually
+    This is a blocking convenience tool that waits until the job
+    completes, fails, or times out. Use this instead of manually
     calling get_job_status in a loop.
 
     Args:
         job_id: Job identifier from combined_simulation_mcp
         timeout_seconds: Maximum time to wait (default 5 minutes)
-        poll_interval_seconds: How often to check status (default 2 seconds)
+        poll_interval_seconds: Longest gap between status checks when the job
+            has no completion handle, e.g. after a server restart; checks
+            start at 0.1 s and back off to this ceiling (default 2 seconds)
 
     Returns:
         Dict with job results if completed, or error status if failed/timeout.
     """
-    import time as time_module
-    import asyncio
+    manager = _job_manager()
+    start = time.time()
 
-    manager = JobManager()
-    start = time_module.time()
+    # Jobs started by this server expose a completion handle - wake on
+    # completion instead of polling. Recovered jobs fall through to polling.
+    await manager.wait_for_completion(job_id, timeout_seconds)
 
-    while time_module.time() - start < timeout_seconds:
+    interval = 0.1
+    while time.time() - start < timeout_seconds:
         status = await manager.get_status(job_id)
 
         if status.get("status") == "completed":
@@ -444,8 +569,9 @@ async def wait_for_job(
                 "error": "Job was terminated before completion"
             }
 
-        # Still running - wait and try again
-        await asyncio.sleep(poll_interval_seconds)
+        # Still running - wait and try again, backing off towards the ceiling
+        await asyncio.sleep(interval)
+        interval = min(interval * 1.5, poll_interval_seconds)
 
     # Timeout reached
     return {
@@ -470,13 +596,12 @@ mcp.tool()(wait_for_job)
 # Tool 6: Parameter sweeps & optimization (Phase 4)
 # mcp.tool()(batch_optimize_degasser)
 
-# Check for required dependencies
-try:
-    from phreeqpython import PhreeqPython
-    PHREEQPYTHON_AVAILABLE = True
+# Check for required dependencies (locate only: the import itself loads the
+# IPhreeqc library, which only Tier 2 jobs need)
+PHREEQPYTHON_AVAILABLE = importlib.util.find_spec("phreeqpython") is not None
+if PHREEQPYTHON_AVAILABLE:
     logger.info("PhreeqPython is available")
-except ImportError:
-    PHREEQPYTHON_AVAILABLE = False
+else:
     logger.warning("PhreeqPython not available - PHREEQC tools will not work")
 
 # Check for database files
@@ -489,70 +614,120 @@ DATABASES = {
     "phreeqc_voc_phases": DB_DIR / "voc_phases.dat"
 }
 
-if __name__ == "__main__":
-    logger.info("Starting Degasser Design MCP server...")
+
+# Server overview, logged as one record by _log_startup_banner()
+_BANNER = """\
+=== DEGASSER DESIGN MCP SERVER ===
+
+[*] THREE-TIER ARCHITECTURE:
+  Tier 1: Fast Heuristic Sizing (<1 sec)
+    - Perry's Handbook correlations
+    - Eckert flooding, HTU/NTU methods
+  Tier 2: PHREEQC Gas-Liquid Equilibrium (10-30 sec)
+    - GAS_PHASE blocks for CO2, H2S, VOC
+    - Multi-stage tower simulation
+  Tier 3: WaterTAP Economic Costing (5-10 sec)
+    - CAPEX, OPEX, LCOW calculations
+    - EPA-WBS correlations
+
+[*] APPLICATIONS:
+  1. CO2 Stripping (Alkalinity Removal)
+     - RO pretreatment, boiler feedwater
+     - Air/water: 20:1-50:1, pH: 4.5-5.5
+  2. H2S Stripping (Sulfide Removal)
+     - Groundwater, industrial wastewater
+     - Air/water: 30:1-100:1, pH: 4.0-5.0
+  3. VOC Stripping (Volatile Organic Removal)
+     - Contaminated groundwater remediation
+     - Henry's law governed mass transfer
+
+[*] DATA SOURCES:
+  • Perry's Chemical Engineers' Handbook (semantic search)
+  • henrys-law.org SQLite database (2 MB, 4632 compounds)
+  • VOC properties from Air-stripping-column repo
+  • Packing catalog with Eckert correlation data
+
+[OK] IMPLEMENTATION STATUS: PHASES 1-3 COMPLETE
+  [OK] Phase 0: Data Acquisition
+     - Downloaded databases from GitHub
+     - Generated unified VOC properties
+     - Created PHREEQC phases definitions
+  [OK] Phase 1: Tier 1 Heuristic Sizing (COMPLETE)
+     - Perry's Eckert GPDC flooding correlation
+     - HTU/NTU method with Eq 14-158
+     - 9 packings in catalog with actual properties
+  [OK] Phase 2: Tier 2 PHREEQC Simulation (COMPLETE)
+     - Multi-stage tower with pH-coupled equilibrium
+     - Bisection for optimal stage count
+  [OK] Phase 3: Tier 3 WaterTAP Costing (COMPLETE)
+     - Shoener 2016 blower costing (QSDsan)
+     - Tang 1984 vessel costing (WaterTAP)
+     - EPA WBS packing & internals costs
+     - Economic metrics: NPV, LCOW, payback
+     - MCP tools: cost_degasser_system_async, combined_simulation_mcp
+  [PENDING] Phase 4: Reports & Optimization (PENDING)
+
+=== SERVER READY FOR DEVELOPMENT ==="""
+
+
+def _log_startup_banner():
+    """Log database availability and the server overview (interactive starts only)."""
     logger.info(f"PhreeqPython available: {PHREEQPYTHON_AVAILABLE}")
 
-    # Check database files
-    logger.info("\n=== CHECKING DATABASE FILES ===")
+    # Check database files (one directory scan; DirEntry caches its stat),
+    # reported as a single record
+    db_lines = ["=== CHECKING DATABASE FILES ==="]
+    missing = False
+    with os.scandir(DB_DIR) as it:
+        entries = {entry.name: entry for entry in it}
     for db_name, db_path in DATABASES.items():
-        if db_path.exists():
-            size_mb = db_path.stat().st_size / (1024 * 1024)
-            logger.info(f"  OK {db_name}: {db_path.name} ({size_mb:.2f} MB)")
+        entry = entries.get(db_path.name)
+        if entry is not None and entry.is_file():
+            size_mb = entry.stat().st_size / (1024 * 1024)
+            db_lines.append(f"  OK {db_name}: {db_path.name} ({size_mb:.2f} MB)")
         else:
-            logger.warning(f"  [X] {db_name}: {db_path.name} NOT FOUND")
+            db_lines.append(f"  [X] {db_name}: {db_path.name} NOT FOUND")
+            missing = True
+    logger.log(logging.WARNING if missing else logging.INFO, "\n%s", "\n".join(db_lines))
 
     # Log server status
-    logger.info("\n=== DEGASSER DESIGN MCP SERVER ===")
-    logger.info("\n[*] THREE-TIER ARCHITECTURE:")
-    logger.info("  Tier 1: Fast Heuristic Sizing (<1 sec)")
-    logger.info("    - Perry's Handbook correlations")
-    logger.info("    - Eckert flooding, HTU/NTU methods")
-    logger.info("  Tier 2: PHREEQC Gas-Liquid Equilibrium (10-30 sec)")
-    logger.info("    - GAS_PHASE blocks for CO2, H2S, VOC")
-    logger.info("    - Multi-stage tower simulation")
-    logger.info("  Tier 3: WaterTAP Economic Costing (5-10 sec)")
-    logger.info("    - CAPEX, OPEX, LCOW calculations")
-    logger.info("    - EPA-WBS correlations")
-
-    logger.info("\n[*] APPLICATIONS:")
-    logger.info("  1. CO2 Stripping (Alkalinity Removal)")
-    logger.info("     - RO pretreatment, boiler feedwater")
-    logger.info("     - Air/water: 20:1-50:1, pH: 4.5-5.5")
-    logger.info("  2. H2S Stripping (Sulfide Removal)")
-    logger.info("     - Groundwater, industrial wastewater")
-    logger.info("     - Air/water: 30:1-100:1, pH: 4.0-5.0")
-    logger.info("  3. VOC Stripping (Volatile Organic Removal)")
-    logger.info("     - Contaminated groundwater remediation")
-    logger.info("     - Henry's law governed mass transfer")
-
-    logger.info("\n[*] DATA SOURCES:")
-    logger.info("  • Perry's Chemical Engineers' Handbook (semantic search)")
-    logger.info("  • henrys-law.org SQLite database (2 MB, 4632 compounds)")
-    logger.info("  • VOC properties from Air-stripping-column repo")
-    logger.info("  • Packing catalog with Eckert correlation data")
-
-    logger.info("\n[OK] IMPLEMENTATION STATUS: PHASES 1-3 COMPLETE")
-    logger.info("  [OK] Phase 0: Data Acquisition")
-    logger.info("     - Downloaded databases from GitHub")
-    logger.info("     - Generated unified VOC properties")
-    logger.info("     - Created PHREEQC phases definitions")
-    logger.info("  [OK] Phase 1: Tier 1 Heuristic Sizing (COMPLETE)")
-    logger.info("     - Perry's Eckert GPDC flooding correlation")
-    logger.info("     - HTU/NTU method with Eq 14-158")
-    logger.info("     - 9 packings in catalog with actual properties")
-    logger.info("  [OK] Phase 2: Tier 2 PHREEQC Simulation (COMPLETE)")
-    logger.info("     - Multi-stage tower with pH-coupled equilibrium")
-    logger.info("     - Bisection for optimal stage count")
-    logger.info("  [OK] Phase 3: Tier 3 WaterTAP Costing (COMPLETE)")
-    logger.info("     - Shoener 2016 blower costing (QSDsan)")
-    logger.info("     - Tang 1984 vessel costing (WaterTAP)")
-    logger.info("     - EPA WBS packing & internals costs")
-    logger.info("     - Economic metrics: NPV, LCOW, payback")
-    logger.info("     - MCP tools: cost_degasser_system_async, combined_simulation_mcp")
-    logger.info("  [PENDING] Phase 4: Reports & Optimization (PENDING)")
-
-    logger.info("\n=== SERVER READY FOR DEVELOPMENT ===")
+    logger.info("\n%s", _BANNER)
+
+
+def _start_costing_preload():
+    """
+    Import the Tier 3 costing stack on a background thread.
+
+    In-process Tier 3 jobs reuse the server's modules, so loading
+    Pyomo/IDAES/WaterTAP and building the shared costing parameter blocks
+    here leaves only the costing itself for the first job. A job that
+    starts earlier waits on the loader's lock instead of importing twice.
+    """
+    def _preload():
+        try:
+            from tools.watertap_costing import get_costing_package, preload_costing_libraries
+
+            start = time.perf_counter()
+            preload_costing_libraries()
+            get_costing_package()
+            logger.info("Tier 3 costing libraries preloaded in %.1f s", time.perf_counter() - start)
+        except Exception as e:
+            logger.warning(f"Tier 3 preload failed, jobs will import on demand: {e}")
+
+    threading.Thread(target=_preload, name="tier3-preload", daemon=True).start()
+
+
+if __name__ == "__main__":
+    logger.info("Starting Degasser Design MCP server...")
+    # The banner (and the database file checks) only serve someone watching
+    # the console; STDIO clients that spawn the server per session skip it
+    if os.environ.get("DEGASSER_BANNER") == "1" or sys.stdin.isatty():
+        _log_startup_banner()
+
+    # Warm the Tier 3 imports while the server handles its first requests;
+    # subprocess jobs import their own copy, and DEGASSER_PRELOAD=0 opts out
+    if _JOB_MODE == "in_process" and os.environ.get("DEGASSER_PRELOAD") != "0":
+        _start_costing_preload()
 
     # Start the server
     mcp.run()
@@ -6,6 +6,7 @@ without requiring a full WaterTAP flowsheet.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -52,6 +53,18 @@ class MockCostingPackage:
         self.tower_internals = m.tower_internals
 
 
+@lru_cache(maxsize=1)
+def get_costing_package():
+    """
+    Parameter blocks for a test model.
+
+    The costing methods only read these blocks (expressions go on the unit's
+    own costing block), so one package is built and shared by all tests,
+    as tools.watertap_costing does for Tier 3 jobs.
+    """
+    return MockCostingPackage()
+
+
 def test_air_blower_costing():
     """Test air blower costing method."""
     print("\n" + "="*80)
@@ -61,7 +74,7 @@ def test_air_blower_costing():
     # Create mock model
     m = ConcreteModel()
     m.fs = Block()
-    m.fs.costing = MockCostingPackage()
+    m.fs.costing = get_costing_package()
 
     # Create mock unit
     m.fs.blower = Block()
@@ -124,7 +137,7 @@ def test_packed_tower_shell_costing():
     # Create mock model
     m = ConcreteModel()
     m.fs = Block()
-    m.fs.costing = MockCostingPackage()
+    m.fs.costing = get_costing_package()
 
     # Create mock unit
     m.fs.tower = Block()
@@ -178,7 +191,7 @@ def test_packing_media_costing():
     # Create mock model
     m = ConcreteModel()
     m.fs = Block()
-    m.fs.costing = MockCostingPackage()
+    m.fs.costing = get_costing_package()
 
     # Create mock unit
     m.fs.packing = Block()
@@ -231,7 +244,7 @@ def test_tower_internals_costing():
     # Create mock model
     m = ConcreteModel()
     m.fs = Block()
-    m.fs.costing = MockCostingPackage()
+    m.fs.costing = get_costing_package()
 
     # Create mock unit
     m.fs.internals = Block()
@@ -293,7 +306,7 @@ def test_complete_degasser_system():
     # Create mock model
     m = ConcreteModel()
     m.fs = Block()
-    m.fs.costing = MockCostingPackage()
+    m.fs.costing = get_costing_package()
 
     # Create all units
     m.fs.blower = Block()
@@ -4,10 +4,22 @@ Detailed mass balance test to understand the 8% error.
 
 import asyncio
 import numpy as np
-from tools.simulation_sizing import get_phreeqc_instance, solve_counter_current_stages, validate_mass_balance
+from tools.simulation_sizing import acquire_phreeqc_instance, solve_counter_current_stages, validate_mass_balance
 from tools.heuristic_sizing import heuristic_sizing
 from tools.schemas import HeuristicSizingInput
 
+
+def solve_15_stages(outcome, convergence_tolerance):
+    """Run the 15-stage solve on a PHREEQC instance of its own."""
+    with acquire_phreeqc_instance() as pp:
+        return solve_counter_current_stages(
+            pp,
+            outcome,
+            N_stages=15,
+            convergence_tolerance=convergence_tolerance
+        )
+
+
 async def main():
     print("Mass balance investigation")
     print("=" * 60)
@@ -25,14 +37,13 @@ async def main():
     )
 
     outcome = await heuristic_sizing(**inputs.model_dump())
-    pp = get_phreeqc_instance()
 
-    # Run simulation with 15 stages
-    profiles = solve_counter_current_stages(
-        pp,
-        outcome,
-        N_stages=15,
-        convergence_tolerance=0.01
+    # Run simulation with 15 stages at the default and a tighter tolerance.
+    # The two solves are independent and PHREEQC releases the GIL, so they
+    # run side by side on separate pooled instances.
+    profiles, profiles_tight = await asyncio.gather(
+        asyncio.to_thread(solve_15_stages, outcome, 0.01),
+        asyncio.to_thread(solve_15_stages, outcome, 0.001)
     )
 
     print(f"\nConvergence info:")
@@ -66,13 +77,6 @@ async def main():
     print(f"\n" + "=" * 60)
     print("Testing with tighter convergence tolerance (0.001):")
 
-    profiles_tight = solve_counter_current_stages(
-        pp,
-        outcome,
-        N_stages=15,
-        convergence_tolerance=0.001
-    )
-
     print(f"\nConvergence info:")
     print(f"  Converged: {profiles_tight['converged']}")
     print(f"  Iterations: {profiles_tight['iterations']}")
@@ -2,39 +2,10 @@
 Debug single equilibrium stage to understand gas phase issue.
 """
 
-from phreeqpython import PhreeqPython
-from chemicals.critical import Tc, Pc
-from chemicals.acentric import omega
-
-# Initialize PhreeqPython
-pp = PhreeqPython()
-
-# Load TCE phase
-Tc_TCE = Tc("79-01-6")
-Pc_TCE = Pc("79-01-6") / 101325
-omega_TCE = omega("79-01-6")
-
-voc_definitions = f"""
-SOLUTION_MASTER_SPECIES
-    Tce     Tce     0   131.388   131.388
-
-SOLUTION_SPECIES
-    Tce = Tce
-        log_k 0.0
-        -gamma 1.0 0.0
-
-PHASES
-    TCE(g)
-        Tce = Tce
-        -log_k   -2.322559
-        -T_c     {Tc_TCE}
-        -P_c     {Pc_TCE:.2f}
-        -Omega   {omega_TCE}
-
-END
-"""
+from tools.simulation_sizing import get_phreeqc_instance
 
-pp.ip.run_string(voc_definitions)
+# Shared PhreeqPython instance with the TCE phase already loaded
+pp = get_phreeqc_instance()
 
 print("Single equilibrium stage test")
 print("=" * 60)
@@ -2,24 +2,10 @@
 Debug phreeqpython solution units.
 """
 
-from phreeqpython import PhreeqPython
+from tools.simulation_sizing import get_phreeqc_instance
 
-pp = PhreeqPython()
-
-# Load TCE phase
-voc_definitions = """
-SOLUTION_MASTER_SPECIES
-    Tce     Tce     0   131.388   131.388
-
-SOLUTION_SPECIES
-    Tce = Tce
-        log_k 0.0
-        -gamma 1.0 0.0
-
-END
-"""
-
-pp.ip.run_string(voc_definitions)
+# Shared PhreeqPython instance with the Tce species already loaded
+pp = get_phreeqc_instance()
 
 print("Testing solution units...")
 print("=" * 60)
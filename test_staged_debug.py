@@ -90,12 +90,10 @@ async def main():
     print("=" * 70)
 
     N_stages = 3
-    C_liq = np.zeros(N_stages)
-    y_gas = np.zeros(N_stages)
 
     # Initialize
-    C_liq[:] = [10.0, 6.0, 2.0]  # Initial guess
-    y_gas[:] = [0.002, 0.001, 0.0]  # Initial guess
+    C_liq = np.array([10.0, 6.0, 2.0])  # Initial guess
+    y_gas = np.array([0.002, 0.001, 0.0])  # Initial guess
 
     print("\nInitial profiles:")
     print(f"  C_liq: {C_liq}")
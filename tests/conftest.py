@@ -0,0 +1,46 @@
+"""
+Shared test setup.
+
+utils/job_manager.py is vendored from the shared MCP job framework, and two of
+the modules it (and server.py) import - utils.path_utils and
+utils.job_state_reconciler - are not part of this repository. Where they are
+missing, minimal stand-ins are registered so server.py imports and its
+wrappers can be tested; an installed copy is always used instead.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+
+class _JobStateReconciler:
+    """Stand-in reconciler: no missed updates to replay or apply."""
+
+    def replay_missed_updates(self, jobs):
+        return 0
+
+    def apply(self, job):
+        return False
+
+
+_VENDORED_STUBS = {
+    "utils.path_utils": {
+        "get_python_executable": lambda: sys.executable,
+        "normalize_path_for_wsl": lambda path: path,
+    },
+    "utils.job_state_reconciler": {
+        "JobStateReconciler": _JobStateReconciler,
+    },
+}
+
+for _name, _attrs in _VENDORED_STUBS.items():
+    if importlib.util.find_spec(_name) is None:
+        _module = types.ModuleType(_name)
+        _module.__dict__.update(_attrs)
+        sys.modules[_name] = _module
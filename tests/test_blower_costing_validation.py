@@ -33,45 +33,24 @@ class TestTier1SmallBlowers:
     - 10 HP (7.5 kW): $18,000 - $22,000
     """
 
-    def test_1hp_blower_cost(self):
-        """Test 1 HP (0.75 kW) small blower cost."""
-        power_kw = 0.75
+    @pytest.mark.parametrize(
+        "label, power_kw, cost_min, cost_max, expected",
+        [
+            ("1 HP", 0.75, 2500, 3800, "$2.5k-$3.5k"),
+            ("3 HP", 2.2, 6500, 8000, "$6.5k-$8k"),
+            ("5 HP", 3.7, 10000, 12500, "$10k-$12.5k"),
+            # 10 HP (7.5 kW) boundary case: just below the 7.5 kW tier threshold
+            ("10 HP", 7.4, 18000, 22000, "$18k-$22k"),
+        ],
+        ids=["1hp", "3hp", "5hp", "10hp"]
+    )
+    def test_small_blower_cost(self, label, power_kw, cost_min, cost_max, expected):
+        """Test small blower installed cost at catalog reference points."""
         cost = cost_small_blower_idaes_sslw(power_kw)
 
-        # Expected range: $2,500 - $3,500 (installed cost)
-        assert 2500 <= cost <= 3800, \
-            f"1 HP blower cost ${cost:,.0f} outside expected range ($2.5k-$3.5k)"
-        print(f"[PASS] 1 HP blower: ${cost:,.0f} (expected $2.5k-$3.5k)")
-
-    def test_3hp_blower_cost(self):
-        """Test 3 HP (2.2 kW) small blower cost."""
-        power_kw = 2.2
-        cost = cost_small_blower_idaes_sslw(power_kw)
-
-        # Expected range: $6,500 - $8,000
-        assert 6500 <= cost <= 8000, \
-            f"3 HP blower cost ${cost:,.0f} outside expected range ($6.5k-$8k)"
-        print(f"[PASS] 3 HP blower: ${cost:,.0f} (expected $6.5k-$8k)")
-
-    def test_5hp_blower_cost(self):
-        """Test 5 HP (3.7 kW) small blower cost."""
-        power_kw = 3.7
-        cost = cost_small_blower_idaes_sslw(power_kw)
-
-        # Expected range: $10,000 - $12,500
-        assert 10000 <= cost <= 12500, \
-            f"5 HP blower cost ${cost:,.0f} outside expected range ($10k-$12.5k)"
-        print(f"[PASS] 5 HP blower: ${cost:,.0f} (expected $10k-$12.5k)")
-
-    def test_10hp_blower_cost(self):
-        """Test 10 HP (7.5 kW) - boundary case at tier transition."""
-        power_kw = 7.4  # Just below 7.5 kW threshold
-        cost = cost_small_blower_idaes_sslw(power_kw)
-
-        # Expected range: $18,000 - $22,000
-        assert 18000 <= cost <= 22000, \
-            f"10 HP blower cost ${cost:,.0f} outside expected range ($18k-$22k)"
-        print(f"[PASS] 10 HP blower: ${cost:,.0f} (expected $18k-$22k)")
+        assert cost_min <= cost <= cost_max, \
+            f"{label} blower cost ${cost:,.0f} outside expected range ({expected})"
+        print(f"[PASS] {label} blower: ${cost:,.0f} (expected {expected})")
 
     def test_material_factor_effect(self):
         """Test material factor (stainless steel) increases cost appropriately."""
@@ -113,35 +92,22 @@ class TestTier2MediumBlowers:
     - 4000 m³/h: ~$52,400
     """
 
-    def test_500m3h_medium_blower(self):
-        """Test 500 m³/h medium blower cost."""
-        flow_m3_h = 500
-        cost = cost_medium_blower_asdc(flow_m3_h)
-
-        # Expected range: ~$13,900
-        assert 12000 <= cost <= 16000, \
-            f"500 m³/h blower cost ${cost:,.0f} outside expected range (~$14k)"
-        print(f"[PASS] 500 m³/h blower: ${cost:,.0f} (expected ~$14k)")
-
-    def test_2000m3h_medium_blower(self):
-        """Test 2000 m³/h medium blower cost."""
-        flow_m3_h = 2000
-        cost = cost_medium_blower_asdc(flow_m3_h)
-
-        # Expected range: ~$32,200
-        assert 30000 <= cost <= 35000, \
-            f"2000 m³/h blower cost ${cost:,.0f} outside expected range (~$32k)"
-        print(f"[PASS] 2000 m³/h blower: ${cost:,.0f} (expected ~$32k)")
-
-    def test_4000m3h_medium_blower(self):
-        """Test 4000 m³/h medium blower cost."""
-        flow_m3_h = 4000
+    @pytest.mark.parametrize(
+        "flow_m3_h, cost_min, cost_max, expected",
+        [
+            (500, 12000, 16000, "~$14k"),     # ASDC: ~$13,900
+            (2000, 30000, 35000, "~$32k"),    # ASDC: ~$32,200
+            (4000, 49000, 56000, "~$52k"),    # ASDC: ~$52,400
+        ],
+        ids=["500m3h", "2000m3h", "4000m3h"]
+    )
+    def test_medium_blower_cost(self, flow_m3_h, cost_min, cost_max, expected):
+        """Test medium blower cost at reference air flows."""
         cost = cost_medium_blower_asdc(flow_m3_h)
 
-        # Expected range: ~$52,400
-        assert 49000 <= cost <= 56000, \
-            f"4000 m³/h blower cost ${cost:,.0f} outside expected range (~$52k)"
-        print(f"[PASS] 4000 m³/h blower: ${cost:,.0f} (expected ~$52k)")
+        assert cost_min <= cost <= cost_max, \
+            f"{flow_m3_h} m³/h blower cost ${cost:,.0f} outside expected range ({expected})"
+        print(f"[PASS] {flow_m3_h} m³/h blower: ${cost:,.0f} (expected {expected})")
 
     def test_out_of_range_raises_error(self):
         """Test that flow outside valid range raises ValueError."""
@@ -169,35 +135,22 @@ class TestTier3LargeBlowers:
     including blower building, air piping network, and bare module factors.
     """
 
-    def test_5000m3h_large_blower(self):
-        """Test 5000 m³/h large industrial blower cost."""
-        flow_m3_h = 5000
-        cost = cost_large_blower_qsdsan(flow_m3_h, n_blowers=1)
-
-        # Expected range: ~$448,000
-        assert 400000 <= cost <= 500000, \
-            f"5000 m³/h blower cost ${cost:,.0f} outside expected range (~$448k)"
-        print(f"[PASS] 5000 m³/h blower: ${cost:,.0f} (expected ~$448k)")
-
-    def test_10000m3h_large_blower(self):
-        """Test 10000 m³/h large industrial blower cost."""
-        flow_m3_h = 10000
-        cost = cost_large_blower_qsdsan(flow_m3_h, n_blowers=1)
-
-        # Expected range: ~$675,000
-        assert 620000 <= cost <= 730000, \
-            f"10000 m³/h blower cost ${cost:,.0f} outside expected range (~$675k)"
-        print(f"[PASS] 10000 m³/h blower: ${cost:,.0f} (expected ~$675k)")
-
-    def test_20000m3h_large_blower(self):
-        """Test 20000 m³/h large industrial blower cost."""
-        flow_m3_h = 20000
+    @pytest.mark.parametrize(
+        "flow_m3_h, cost_min, cost_max, expected",
+        [
+            (5000, 400000, 500000, "~$448k"),      # QSDsan: ~$448,000
+            (10000, 620000, 730000, "~$675k"),     # QSDsan: ~$675,000
+            (20000, 950000, 1100000, "~$1M"),      # QSDsan: ~$1,018,000
+        ],
+        ids=["5000m3h", "10000m3h", "20000m3h"]
+    )
+    def test_large_blower_cost(self, flow_m3_h, cost_min, cost_max, expected):
+        """Test large industrial blower cost at reference air flows."""
         cost = cost_large_blower_qsdsan(flow_m3_h, n_blowers=1)
 
-        # Expected range: ~$1,018,000
-        assert 950000 <= cost <= 1100000, \
-            f"20000 m³/h blower cost ${cost:,.0f} outside expected range (~$1M)"
-        print(f"[PASS] 20000 m³/h blower: ${cost:,.0f} (expected ~$1M)")
+        assert cost_min <= cost <= cost_max, \
+            f"{flow_m3_h} m³/h blower cost ${cost:,.0f} outside expected range ({expected})"
+        print(f"[PASS] {flow_m3_h} m³/h blower: ${cost:,.0f} (expected {expected})")
 
     def test_multiple_blowers_scaling(self):
         """Test N_blowers^0.377 scaling factor."""
@@ -347,62 +300,4 @@ class TestRealWorldCases:
 
 
 if __name__ == "__main__":
-    """Run all validation tests."""
-
-    print("=" * 70)
-    print("BLOWER COSTING VALIDATION TEST SUITE")
-    print("=" * 70)
-
-    # Test Tier 1: Small blowers
-    print("\n" + "=" * 70)
-    print("TIER 1: SMALL BLOWERS (< 7.5 kW) - IDAES SSLW")
-    print("=" * 70)
-    tier1 = TestTier1SmallBlowers()
-    tier1.test_1hp_blower_cost()
-    tier1.test_3hp_blower_cost()
-    tier1.test_5hp_blower_cost()
-    tier1.test_10hp_blower_cost()
-    tier1.test_material_factor_effect()
-    tier1.test_out_of_range_raises_error()
-
-    # Test Tier 2: Medium blowers
-    print("\n" + "=" * 70)
-    print("TIER 2: MEDIUM BLOWERS (7.5-37.5 kW) - ASDC")
-    print("=" * 70)
-    tier2 = TestTier2MediumBlowers()
-    tier2.test_500m3h_medium_blower()
-    tier2.test_2000m3h_medium_blower()
-    tier2.test_4000m3h_medium_blower()
-    tier2.test_out_of_range_raises_error()
-
-    # Test Tier 3: Large blowers
-    print("\n" + "=" * 70)
-    print("TIER 3: LARGE BLOWERS (> 37.5 kW) - QSDsan")
-    print("=" * 70)
-    tier3 = TestTier3LargeBlowers()
-    tier3.test_5000m3h_large_blower()
-    tier3.test_10000m3h_large_blower()
-    tier3.test_20000m3h_large_blower()
-    tier3.test_multiple_blowers_scaling()
-    tier3.test_out_of_range_raises_error()
-
-    # Test tier transitions
-    print("\n" + "=" * 70)
-    print("TIER TRANSITIONS")
-    print("=" * 70)
-    transitions = TestTierTransitions()
-    transitions.test_tier1_tier2_boundary()
-    transitions.test_tier2_tier3_boundary()
-
-    # Test real-world cases
-    print("\n" + "=" * 70)
-    print("REAL-WORLD DESIGN CASES")
-    print("=" * 70)
-    real_world = TestRealWorldCases()
-    real_world.test_bug_case_co2_stripping()
-    real_world.test_h2s_stripping_case()
-    real_world.test_large_wastewater_plant()
-
-    print("\n" + "=" * 70)
-    print("ALL VALIDATION TESTS PASSED [PASS]")
-    print("=" * 70)
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,66 @@
+"""
+Tests for the VOC Henry's constant lookup (voc_properties.json index).
+"""
+
+import logging
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+from utils import henry_constants
+
+
+VOC_PROPERTIES = {
+    "79-01-6": {
+        "name": "Trichloroethylene",
+        "common_names": ["TCE", "Trichloroethene"],
+        "henry_constant_25C": 0.403,
+        "henry_enthalpy": 33000,
+    },
+    "00-00-1": {
+        "name": "Unmeasured compound",
+        "common_names": ["NOH"],
+    },
+}
+
+
+@pytest.fixture
+def voc_database(monkeypatch):
+    """Swap in a small voc_properties.json and reset the lookup caches."""
+    caches = (
+        henry_constants._voc_index,
+        henry_constants._voc_keys_without_henry,
+        henry_constants._voc_henry_at_temperature,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    monkeypatch.setattr(henry_constants, "_read_voc_properties", lambda: VOC_PROPERTIES)
+    yield
+    for cache in caches:
+        cache.cache_clear()
+
+
+class TestMissingHenryWarnings:
+    """Entries without a Henry's constant only warn when they are looked up"""
+
+    def test_index_build_does_not_warn(self, voc_database, caplog):
+        with caplog.at_level(logging.DEBUG, logger=henry_constants.logger.name):
+            result = henry_constants.get_voc_henry_constant("TCE")
+
+        assert result["cas_number"] == "79-01-6"
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+        assert any("00-00-1" in r.getMessage() for r in caplog.records
+                   if r.levelno == logging.DEBUG)
+
+    def test_lookup_of_entry_without_henry_warns(self, voc_database, caplog):
+        with caplog.at_level(logging.WARNING, logger=henry_constants.logger.name):
+            result = henry_constants.get_voc_henry_constant("noh")
+
+        assert result is None
+        assert any("No Henry's constant for noh in VOC database" in r.getMessage()
+                   for r in caplog.records)
@@ -0,0 +1,78 @@
+"""
+Tests for the Tier 1 schema helpers.
+
+Tier1Outcome.to_dict() replaced a generic recursive converter in the server
+and the tier2/tier3 runners; it must produce exactly what that converter did.
+"""
+
+import pytest
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+from pydantic import BaseModel
+
+# Add parent directory to path
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+from tools.heuristic_sizing import heuristic_sizing
+
+
+def convert_to_dict(obj):
+    """The generic converter to_dict() replaced (Python-mode model_dump)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    elif hasattr(obj, '__dataclass_fields__'):
+        return {field.name: convert_to_dict(getattr(obj, field.name)) for field in fields(obj)}
+    elif isinstance(obj, list):
+        return [convert_to_dict(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {k: convert_to_dict(v) for k, v in obj.items()}
+    else:
+        return obj
+
+
+class TestTier1OutcomeToDict:
+    """to_dict() must match the generic converter for every field type"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [
+        # Literal, floats, Optional None, nested blower specs, warnings list
+        {"application": "CO2", "water_flow_rate_m3_h": 100.0,
+         "inlet_concentration_mg_L": 50.0, "outlet_concentration_mg_L": 5.0,
+         "water_ph": 5.0},
+        {"application": "VOC", "water_flow_rate_m3_h": 100.0,
+         "inlet_concentration_mg_L": 1.0, "outlet_concentration_mg_L": 0.005,
+         "include_blower_sizing": False},
+        # Water chemistry dataclass with nested dicts
+        {"application": "H2S", "water_flow_rate_m3_h": 50.0,
+         "inlet_concentration_mg_L": 5.0, "outlet_concentration_mg_L": 0.1,
+         "water_ph": 6.0,
+         "water_chemistry_json": '{"Ca_2+": 40, "Na_+": 20, "HCO3_-": 120, "Cl_-": 35}'},
+    ], ids=["co2", "voc_no_blower", "h2s_water_chemistry"])
+    async def test_matches_generic_conversion(self, params):
+        outcome = await heuristic_sizing(**params)
+
+        converted = outcome.to_dict()
+
+        assert converted == convert_to_dict(outcome)
+        # Same value types too (== treats 1 == 1.0 and str enums loosely)
+        assert repr(converted) == repr(convert_to_dict(outcome))
+
+    @pytest.mark.asyncio
+    async def test_returns_fresh_containers(self):
+        outcome = await heuristic_sizing(
+            application="CO2", water_flow_rate_m3_h=100.0,
+            inlet_concentration_mg_L=50.0, outlet_concentration_mg_L=5.0,
+            water_ph=5.0
+        )
+
+        first = outcome.to_dict()
+        first["result"]["warnings"].clear()
+        first["request"]["application"] = "mutated"
+
+        second = outcome.to_dict()
+        assert second["request"]["application"] == "CO2"
+        assert second["result"]["warnings"] == convert_to_dict(outcome)["result"]["warnings"]
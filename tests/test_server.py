@@ -0,0 +1,175 @@
+"""
+Tests for the MCP server wrappers.
+
+server.py pulls in the vendored job-management utilities; conftest.py
+stands in for the ones not shipped with this repository.
+"""
+
+import inspect
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+server = pytest.importorskip("server")
+
+
+CO2_PARAMS = {
+    "application": "CO2",
+    "water_flow_rate_m3_h": 100.0,
+    "inlet_concentration_mg_L": 50.0,
+    "outlet_concentration_mg_L": 5.0,
+    "water_ph": 5.0,
+}
+
+
+class TestTier1Cache:
+    """The Tier 1 LRU must not hand the same mutable response to two callers"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_fresh_dict(self):
+        server._tier1_cache.clear()
+
+        first = await server.heuristic_sizing_mcp(**CO2_PARAMS)
+        second = await server.heuristic_sizing_mcp(**CO2_PARAMS)
+
+        assert len(server._tier1_cache) == 1
+        assert first == second
+        assert first is not second
+        assert first["result"] is not second["result"]
+
+    @pytest.mark.asyncio
+    async def test_mutating_a_response_does_not_poison_the_cache(self):
+        server._tier1_cache.clear()
+
+        first = await server.heuristic_sizing_mcp(**CO2_PARAMS)
+        expected_height = first["result"]["tower_height_m"]
+        first["result"]["tower_height_m"] = -1.0
+        first["result"]["warnings"].append({"message": "mutated"})
+        first.clear()
+
+        again = await server.heuristic_sizing_mcp(**CO2_PARAMS)
+        assert again["result"]["tower_height_m"] == expected_height
+        assert {"message": "mutated"} not in again["result"]["warnings"]
+
+    @pytest.mark.asyncio
+    async def test_batch_slots_are_independent(self):
+        server._tier1_cache.clear()
+
+        results = await server.batch_heuristic_sizing_mcp([CO2_PARAMS, CO2_PARAMS])
+
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+
+
+class TestMaxConcurrentJobs:
+    """DEGASSER_MAX_CONCURRENT parsing"""
+
+    def test_default_is_capped_at_three(self, monkeypatch):
+        monkeypatch.delenv("DEGASSER_MAX_CONCURRENT", raising=False)
+        assert 1 <= server._max_concurrent_jobs() <= 3
+
+    def test_override(self, monkeypatch):
+        monkeypatch.setenv("DEGASSER_MAX_CONCURRENT", "5")
+        assert server._max_concurrent_jobs() == 5
+
+    @pytest.mark.parametrize("raw", ["", "two", "1.5"])
+    def test_malformed_value_falls_back_to_default(self, monkeypatch, raw):
+        monkeypatch.delenv("DEGASSER_MAX_CONCURRENT", raising=False)
+        default = server._max_concurrent_jobs()
+
+        monkeypatch.setenv("DEGASSER_MAX_CONCURRENT", raw)
+        assert server._max_concurrent_jobs() == default
+
+    @pytest.mark.parametrize("raw", ["0", "-2"])
+    def test_non_positive_value_is_clamped_to_one(self, monkeypatch, raw):
+        monkeypatch.setenv("DEGASSER_MAX_CONCURRENT", raw)
+        assert server._max_concurrent_jobs() == 1
+
+
+class TestJobMode:
+    """DEGASSER_JOB_MODE parsing"""
+
+    def test_default_is_subprocess(self, monkeypatch):
+        monkeypatch.delenv("DEGASSER_JOB_MODE", raising=False)
+        assert server._job_mode() == "subprocess"
+
+    @pytest.mark.parametrize("raw", ["subprocess", "in_process"])
+    def test_known_modes(self, monkeypatch, raw):
+        monkeypatch.setenv("DEGASSER_JOB_MODE", raw)
+        assert server._job_mode() == raw
+
+    @pytest.mark.parametrize("raw", ["", "inprocess", "IN_PROCESS", "thread"])
+    def test_unknown_mode_falls_back_to_subprocess(self, monkeypatch, raw):
+        monkeypatch.setenv("DEGASSER_JOB_MODE", raw)
+        assert server._job_mode() == "subprocess"
+
+
+class _RecordingJobManager:
+    """Stands in for JobManager: keeps the job directory, starts nothing."""
+
+    def __init__(self, jobs_dir):
+        self.jobs_dir = jobs_dir
+
+    async def execute(self, cmd, cwd=".", env=None, job_id=None):
+        return {"id": job_id}
+
+    async def execute_async(self, runner, *args, job_id=None, **kwargs):
+        return {"id": job_id}
+
+    async def _save_job_metadata_async(self, job):
+        pass
+
+
+class TestJobParams:
+    """params.json written for Tier 2/3 jobs"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("run_flag", ["run_tier2", "run_tier3"])
+    async def test_params_json_has_every_job_argument(self, monkeypatch, tmp_path, run_flag):
+        monkeypatch.setattr(server, "_job_manager", lambda: _RecordingJobManager(tmp_path))
+
+        signature = inspect.signature(server.combined_simulation_mcp)
+        # Every argument set (no None), so every forwarded name must appear
+        arguments = {
+            name: param.default for name, param in signature.parameters.items()
+            if param.default is not inspect.Parameter.empty
+        }
+        arguments.update(
+            CO2_PARAMS,
+            packing_id="pall_rings_25mm",
+            henry_constant_25C=0.8,
+            water_chemistry_json="{}",
+            blower_efficiency_override=0.7,
+            num_stages_initial=6,
+            run_tier2=False,
+            run_tier3=False,
+        )
+        arguments[run_flag] = True
+
+        response = await server.combined_simulation_mcp(**arguments)
+
+        params = json.loads((tmp_path / response["job_id"] / "params.json").read_text())
+        expected = {
+            name: value for name, value in arguments.items()
+            if name not in ("run_tier2", "run_tier3")
+        }
+        assert params == expected
+
+    @pytest.mark.asyncio
+    async def test_none_arguments_are_omitted(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(server, "_job_manager", lambda: _RecordingJobManager(tmp_path))
+
+        response = await server.combined_simulation_mcp(**CO2_PARAMS, run_tier2=True)
+
+        params = json.loads((tmp_path / response["job_id"] / "params.json").read_text())
+        assert set(params) == set(CO2_PARAMS) | {
+            "air_water_ratio", "temperature_c", "include_blower_sizing",
+            "motor_efficiency", "find_optimal_stages", "packing_type"
+        }
+        assert None not in params.values()
@@ -383,6 +383,37 @@ class TestSimulationSizing:
             f"Mass balance error {mass_balance['error_fraction']:.2%} exceeds 1% tolerance"
 
 
+
+class TestPhreeqcPool:
+    """Pooled PhreeqPython instances are only reused after a clean borrow"""
+
+    @pytest.fixture
+    def fresh_pool(self, monkeypatch):
+        import queue
+        import tools.simulation_sizing as sim
+
+        monkeypatch.setattr(sim, "_pp_pool", queue.SimpleQueue())
+        monkeypatch.setattr(sim, "_create_phreeqc_instance", object)
+        return sim
+
+    def test_instance_is_reused_after_success(self, fresh_pool):
+        with fresh_pool.acquire_phreeqc_instance() as first:
+            pass
+        with fresh_pool.acquire_phreeqc_instance() as second:
+            pass
+
+        assert second is first
+
+    def test_instance_is_discarded_after_error(self, fresh_pool):
+        with pytest.raises(RuntimeError):
+            with fresh_pool.acquire_phreeqc_instance() as failed:
+                raise RuntimeError("stage failed before DELETE")
+
+        assert fresh_pool._pp_pool.empty()
+        with fresh_pool.acquire_phreeqc_instance() as replacement:
+            pass
+        assert replacement is not failed
+
 # =============================================================================
 # HELPER: Run tests with verbose output
 # =============================================================================
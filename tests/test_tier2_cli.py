@@ -0,0 +1,85 @@
+"""
+Tests for the Tier 2 job runner's result writing.
+"""
+
+import asyncio
+import numpy as np
+import orjson
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = Path(__file__).parent.parent
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+import tools.simulation_sizing
+from utils.tier2_cli import check_finite, run_tier2_simulation
+
+
+PARAMS = {
+    "application": "VOC",
+    "water_flow_rate_m3_h": 100.0,
+    "inlet_concentration_mg_L": 1.0,
+    "outlet_concentration_mg_L": 0.005,
+    "num_stages_initial": 3,
+    "find_optimal_stages": False,
+}
+
+
+def _fake_tier2_result(y_gas):
+    return {
+        "theoretical_stages": 3,
+        "tower_height_m": 2.2,
+        "C_liq": np.array([1.0, 0.1, 0.01, 0.005]),
+        "y_gas": y_gas,
+        "pH": np.array([7.0, 7.0, 7.0, 7.0]),
+    }
+
+
+class TestCheckFinite:
+    """check_finite() stands in for json.dump(allow_nan=False)"""
+
+    def test_finite_result_passes(self):
+        check_finite({"a": [1.0, 2], "b": np.array([0.5, 1.5]), "c": "text", "d": None})
+
+    @pytest.mark.parametrize("value", [
+        float("nan"),
+        float("inf"),
+        [1.0, float("-inf")],
+        np.array([1.0, np.nan]),
+        {"nested": {"deeper": np.float64("nan")}},
+    ])
+    def test_non_finite_value_raises(self, value):
+        with pytest.raises(ValueError, match="Non-finite"):
+            check_finite({"tier2": value})
+
+
+class TestTier2ResultWriting:
+    """A NaN stage profile fails the job instead of being written as null"""
+
+    def _run(self, monkeypatch, tmp_path, y_gas):
+        monkeypatch.setattr(
+            tools.simulation_sizing, "staged_column_simulation",
+            lambda *args, **kwargs: _fake_tier2_result(y_gas)
+        )
+        exit_code = asyncio.run(run_tier2_simulation(tmp_path, params=dict(PARAMS)))
+        return exit_code, orjson.loads((tmp_path / "tier2_results.json").read_bytes())
+
+    def test_nan_profile_fails_job(self, monkeypatch, tmp_path):
+        exit_code, written = self._run(
+            monkeypatch, tmp_path, np.array([1e-4, np.nan, 1e-6, 0.0])
+        )
+
+        assert exit_code == 1
+        assert written["status"] == "error"
+        assert "Non-finite values in result.tier2.y_gas" in written["message"]
+
+    def test_finite_profile_is_written(self, monkeypatch, tmp_path):
+        exit_code, written = self._run(
+            monkeypatch, tmp_path, np.array([1e-4, 1e-5, 1e-6, 0.0])
+        )
+
+        assert exit_code == 0
+        assert written["tier2"]["y_gas"] == [1e-4, 1e-5, 1e-6, 0.0]
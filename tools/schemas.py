@@ -521,6 +521,34 @@ class PackingCatalogResult(BaseModel):
     )
 
 
+@dataclass(frozen=True, slots=True)
+class Tier1Inputs:
+    """
+    heuristic_sizing arguments as one hashable record.
+
+    Fields and defaults mirror heuristic_sizing(). Constructing one binds
+    and defaults the arguments in a single call, so the server uses it as
+    the Tier 1 cache key and forwards it with as_kwargs().
+    """
+    application: str
+    water_flow_rate_m3_h: float
+    inlet_concentration_mg_L: float
+    outlet_concentration_mg_L: float
+    air_water_ratio: float = 30.0
+    temperature_c: float = 25.0
+    packing_id: Optional[str] = None
+    henry_constant_25C: Optional[float] = None
+    water_ph: Optional[float] = None
+    water_chemistry_json: Optional[str] = None
+    include_blower_sizing: bool = True
+    blower_efficiency_override: Optional[float] = None
+    motor_efficiency: float = 0.92
+
+    def as_kwargs(self) -> dict:
+        """Keyword arguments for heuristic_sizing()."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 @dataclass
 class Tier1Outcome:
     """
@@ -543,3 +571,26 @@ class Tier1Outcome:
     molecular_weight: float  # Application-specific MW
     gas_phase_name: str  # PHREEQC phase name for equilibrium_stage()
     water_chemistry: Optional[WaterChemistryData] = None
+
+    def to_dict(self) -> dict:
+        """
+        Plain-dict form for JSON responses.
+
+        Same output as a recursive model_dump()/dataclass-field walk: the
+        Pydantic models are dumped in Python mode and the water chemistry
+        dataclass is copied field by field (no dataclasses.asdict deepcopy).
+        """
+        water_chemistry = self.water_chemistry
+        return {
+            "request": self.request.model_dump(),
+            "result": self.result.model_dump(),
+            "henry_constant": self.henry_constant,
+            "molecular_weight": self.molecular_weight,
+            "gas_phase_name": self.gas_phase_name,
+            "water_chemistry": None if water_chemistry is None else {
+                "ion_composition_mg_l": dict(water_chemistry.ion_composition_mg_l),
+                "phreeqc_solution_mg_l": dict(water_chemistry.phreeqc_solution_mg_l),
+                "charge_balance_percent": water_chemistry.charge_balance_percent,
+                "source": water_chemistry.source,
+            },
+        }
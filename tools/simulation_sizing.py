@@ -18,7 +18,12 @@ Architecture validated by Codex consultation and Perry's Handbook theory.
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+import math
+import queue
+import threading
+from contextlib import contextmanager
 from utils.water_chemistry import build_phreeqc_solution, get_default_water_chemistry
 
 # PHREEQC integration
@@ -32,6 +37,8 @@ except ImportError:
 from utils.speciation import strippable_fraction as calculate_strippable_fraction
 from tools.schemas import Tier1Outcome
 
+# Debug calls inside the stage/iteration loops use lazy %-style arguments
+# (not f-strings) so no message is built unless DEBUG is enabled
 logger = logging.getLogger(__name__)
 
 # Default background water chemistry (municipal template converted to PHREEQC)
@@ -55,55 +62,36 @@ AQUEOUS_REDOX_STATE_MAP = {
 # MODULE-LEVEL CACHING (Codex Recommendation)
 # ============================================================================
 
-_pp_instance = None
-
-def get_phreeqc_instance():
+@lru_cache(maxsize=1)
+def _voc_phase_definitions() -> str:
     """
-    Get cached PhreeqPython instance with VOC phases loaded.
+    Build the PHREEQC input that registers the custom VOC species and phases.
 
-    Instance is created once at first call and reused for all subsequent calls.
-    This saves 1-2 seconds of initialization overhead per simulation.
-
-    Returns:
-        PhreeqPython: Cached instance with VOC definitions loaded
-
-    Raises:
-        ImportError: If phreeqpython is not available
+    The critical properties are looked up once per process; every pooled or
+    per-thread instance loads the same string.
     """
-    if not PHREEQPYTHON_AVAILABLE:
-        raise ImportError(
-            "phreeqpython is required for Tier 2 simulation. "
-            "Install with: pip install phreeqpython"
-        )
-
-    global _pp_instance
-    if _pp_instance is None:
-        logger.info("Initializing PhreeqPython instance (first call)")
-        _pp_instance = PhreeqPython()
-
-        # Load VOC phase definitions at runtime with critical properties
-        # Critical properties from chemicals library (Yaws Collection + DIPPR databases)
-        # Required for Peng-Robinson EOS to match N2(g), H2S(g), CO2(g) in standard database
-        from chemicals.critical import Tc, Pc
-        from chemicals.acentric import omega
-
-        # Fetch critical properties from canonical sources
-        # TCE (Trichloroethylene, CAS 79-01-6)
-        Tc_TCE = Tc("79-01-6")  # K
-        Pc_TCE = Pc("79-01-6") / 101325  # Convert Pa to atm for PHREEQC
-        omega_TCE = omega("79-01-6")
-
-        # CCl4 (Carbon Tetrachloride, CAS 56-23-5)
-        Tc_CCl4 = Tc("56-23-5")  # K
-        Pc_CCl4 = Pc("56-23-5") / 101325  # Convert Pa to atm for PHREEQC
-        omega_CCl4 = omega("56-23-5")
-
-        logger.info(f"TCE critical properties: Tc={Tc_TCE} K, Pc={Pc_TCE:.2f} atm, omega={omega_TCE}")
-        logger.info(f"CCl4 critical properties: Tc={Tc_CCl4} K, Pc={Pc_CCl4:.2f} atm, omega={omega_CCl4}")
-
-        # Format validated in test_voc_phases.py
-        # NOTE: H2S and CO2 are already built into PHREEQC, so we only add custom VOCs
-        voc_definitions = f"""
+    # Critical properties from chemicals library (Yaws Collection + DIPPR databases)
+    # Required for Peng-Robinson EOS to match N2(g), H2S(g), CO2(g) in standard database
+    from chemicals.critical import Tc, Pc
+    from chemicals.acentric import omega
+
+    # Fetch critical properties from canonical sources
+    # TCE (Trichloroethylene, CAS 79-01-6)
+    Tc_TCE = Tc("79-01-6")  # K
+    Pc_TCE = Pc("79-01-6") / 101325  # Convert Pa to atm for PHREEQC
+    omega_TCE = omega("79-01-6")
+
+    # CCl4 (Carbon Tetrachloride, CAS 56-23-5)
+    Tc_CCl4 = Tc("56-23-5")  # K
+    Pc_CCl4 = Pc("56-23-5") / 101325  # Convert Pa to atm for PHREEQC
+    omega_CCl4 = omega("56-23-5")
+
+    logger.info(f"TCE critical properties: Tc={Tc_TCE} K, Pc={Pc_TCE:.2f} atm, omega={omega_TCE}")
+    logger.info(f"CCl4 critical properties: Tc={Tc_CCl4} K, Pc={Pc_CCl4:.2f} atm, omega={omega_CCl4}")
+
+    # Format validated in test_voc_phases.py
+    # NOTE: H2S and CO2 are already built into PHREEQC, so we only add custom VOCs
+    return f"""
 SOLUTION_MASTER_SPECIES
     Tce     Tce     0   131.388   131.388
     Ct      Ct      0   153.823   153.823
@@ -134,10 +122,76 @@ PHASES
 
 END
 """
-        _pp_instance.ip.run_string(voc_definitions)
-        logger.info("VOC phases loaded successfully with Peng-Robinson EOS parameters")
 
-    return _pp_instance
+
+def _create_phreeqc_instance():
+    """Build a PhreeqPython instance with the VOC phase definitions loaded."""
+    if not PHREEQPYTHON_AVAILABLE:
+        raise ImportError(
+            "phreeqpython is required for Tier 2 simulation. "
+            "Install with: pip install phreeqpython"
+        )
+
+    logger.info("Initializing PhreeqPython instance")
+    pp = PhreeqPython()
+
+    # Load VOC phase definitions at runtime with critical properties
+    pp.ip.run_string(_voc_phase_definitions())
+    logger.info("VOC phases loaded successfully with Peng-Robinson EOS parameters")
+
+    return pp
+
+
+# Warm instances not currently in use. IPhreeqc is not thread-safe, so an
+# instance is only ever held by one caller at a time, but any thread may
+# borrow any idle instance; the pool grows to the peak concurrency.
+_pp_pool: "queue.SimpleQueue" = queue.SimpleQueue()
+
+
+@contextmanager
+def acquire_phreeqc_instance():
+    """
+    Borrow a warm PhreeqPython instance for exclusive use.
+
+    Reuses an idle pooled instance when there is one (saving the 1-2 s
+    database and VOC phase initialization) and returns it to the pool on
+    exit. Stage calculations forget their solutions and gas phases only
+    when they complete, so an instance whose borrower raised is discarded
+    rather than returned; the pool never hands out leftover state.
+
+    Raises:
+        ImportError: If phreeqpython is not available
+    """
+    try:
+        pp = _pp_pool.get_nowait()
+    except queue.Empty:
+        pp = _create_phreeqc_instance()
+    yield pp
+    _pp_pool.put(pp)
+
+
+# Per-thread instance for callers driving the stage-level functions directly
+_pp_local = threading.local()
+
+def get_phreeqc_instance():
+    """
+    Get cached PhreeqPython instance with VOC phases loaded.
+
+    Instance is created once per thread at first call and reused for all
+    subsequent calls on that thread. This saves 1-2 seconds of
+    initialization overhead per simulation. staged_column_simulation()
+    borrows from the shared pool instead (acquire_phreeqc_instance()).
+
+    Returns:
+        PhreeqPython: Cached instance with VOC definitions loaded
+
+    Raises:
+        ImportError: If phreeqpython is not available
+    """
+    pp = getattr(_pp_local, "instance", None)
+    if pp is None:
+        pp = _pp_local.instance = _create_phreeqc_instance()
+    return pp
 
 
 # ============================================================================
@@ -201,10 +255,10 @@ def equilibrium_stage(
     # For VOCs (custom species), add to solution dict before creation
     if aqueous_species_name not in ["H2S", "CO2"]:
         solution_dict[aqueous_species_name] = C_liq_in_mg_L
-        logger.debug(f"Adding {aqueous_species_name}: {C_liq_in_mg_L:.3f} mg/L to solution dict")
+        logger.debug("Adding %s: %.3f mg/L to solution dict", aqueous_species_name, C_liq_in_mg_L)
 
     # Create the solution with background chemistry (and VOCs if applicable)
-    logger.debug(f"Complete solution_dict before add_solution(): {solution_dict}")
+    logger.debug("Complete solution_dict before add_solution(): %s", solution_dict)
     sol = pp.add_solution(solution_dict)
 
     # FIX 1 (Phase 2): Track background C(4) for CO2 to enable delta tracking
@@ -214,7 +268,7 @@ def equilibrium_stage(
     if aqueous_species_name == "CO2":
         redox_state = AQUEOUS_REDOX_STATE_MAP.get("CO2")
         background_C4_mol = sol.total(redox_state, units='mol') or 0.0
-        logger.debug(f"Background {redox_state} before adding CO2: {background_C4_mol:.6e} mol")
+        logger.debug("Background %s before adding CO2: %.6e mol", redox_state, background_C4_mol)
 
     # Then add H2S/CO2 using sol.change() which uses REACTION blocks
     # Must use the correct AQUEOUS SPECIES names from vitens.dat database
@@ -222,13 +276,13 @@ def equilibrium_stage(
         # Convert mg/L H2S to mol/kg (1 L ≈ 1 kg for dilute solutions)
         # Use "HS-" which is the master species name in vitens.dat
         mol_sulfide = (C_liq_in_mg_L / 1000.0) / 34.076  # H2S MW = 34.076
-        logger.debug(f"Adding {C_liq_in_mg_L:.3f} mg/L H2S = {mol_sulfide:.6e} mol HS- via sol.change()")
+        logger.debug("Adding %.3f mg/L H2S = %.6e mol HS- via sol.change()", C_liq_in_mg_L, mol_sulfide)
         sol.change({"HS-": mol_sulfide}, units="mol")
     elif aqueous_species_name == "CO2":
         # Convert mg/L CO2 to mol/kg
         # Use "CO2" which is the aqueous species name in vitens.dat
         mol_co2 = (C_liq_in_mg_L / 1000.0) / 44.01  # CO2 MW = 44.01
-        logger.debug(f"Adding {C_liq_in_mg_L:.3f} mg/L CO2 = {mol_co2:.6e} mol CO2 via sol.change()")
+        logger.debug("Adding %.3f mg/L CO2 = %.6e mol CO2 via sol.change()", C_liq_in_mg_L, mol_co2)
         sol.change({"CO2": mol_co2}, units="mol")
 
     # Create gas phase representing gas entering from stage above (counter-current)
@@ -280,14 +334,14 @@ def equilibrium_stage(
     # For CO2: Subtract background to get contaminant only
     if aqueous_species_name == "CO2":
         C_out_mol = C_after_total_mol - background_C4_mol
-        logger.debug(f"After interact - sol.total('{redox_component}'): {C_after_total_mol:.6e} mol")
-        logger.debug(f"Subtracting background: {background_C4_mol:.6e} mol")
-        logger.debug(f"CO2 contaminant (net): {C_out_mol:.6e} mol")
+        logger.debug("After interact - sol.total('%s'): %.6e mol", redox_component, C_after_total_mol)
+        logger.debug("Subtracting background: %.6e mol", background_C4_mol)
+        logger.debug("CO2 contaminant (net): %.6e mol", C_out_mol)
     else:
         # For H2S: S(-2) excludes background S(6), no subtraction needed
         # For VOC: Direct species, no background
         C_out_mol = C_after_total_mol
-        logger.debug(f"After interact - sol.total('{redox_component}'): {C_after_total_mol:.6e} mol")
+        logger.debug("After interact - sol.total('%s'): %.6e mol", redox_component, C_after_total_mol)
 
     # Convert mol to mg/L (multiply by MW and 1000)
     C_out_mg_L = C_out_mol * molecular_weight * 1000.0
@@ -305,8 +359,10 @@ def equilibrium_stage(
         y_out_frac = n_contaminant_out / total_moles_out if total_moles_out > 0 else 0.0
 
         # Log for debugging
-        logger.debug(f"Gas out: P={gas.pressure:.3f} atm, total={total_moles_out:.3f} mol, "
-                    f"n_VOC={n_contaminant_out:.6e} mol, y_out={y_out_frac:.6e}")
+        # (guarded: gas.pressure is a PHREEQC query, not a stored value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Gas out: P=%.3f atm, total=%.3f mol, n_VOC=%.6e mol, y_out=%.6e",
+                         gas.pressure, total_moles_out, n_contaminant_out, y_out_frac)
 
     except (AttributeError, KeyError, ZeroDivisionError) as e:
         logger.warning(f"Error extracting gas composition: {e}")
@@ -315,7 +371,7 @@ def equilibrium_stage(
             partial_pressure_atm = gas.partial_pressures.get(gas_phase_name, 0.0)
             total_pressure_atm = gas.pressure
             y_out_frac = partial_pressure_atm / total_pressure_atm if total_pressure_atm > 0 else 0.0
-            logger.debug(f"Using partial pressure method: P_VOC={partial_pressure_atm:.6e}, y_out={y_out_frac:.6e}")
+            logger.debug("Using partial pressure method: P_VOC=%.6e, y_out=%.6e", partial_pressure_atm, y_out_frac)
         except:
             y_out_frac = 0.0
             logger.error("Failed to extract gas composition!")
@@ -323,12 +379,10 @@ def equilibrium_stage(
     pH_out = sol.pH
 
     # Memory management: prevent Solution object accumulation
-    # (Codex recommendation based on phreeqpython tests)
-    sol.forget()
-    try:
-        gas.forget()
-    except AttributeError:
-        pass
+    # (Codex recommendation based on phreeqpython tests). Solution and gas
+    # phase go in one DELETE block - same effect as sol.forget() plus
+    # gas.forget(), one PHREEQC run instead of two.
+    pp.ip.run_string(f"DELETE\n-solution {sol.number}\n-gas_phase {gas.number}")
 
     return C_out_mg_L, y_out_frac, pH_out
 
@@ -410,8 +464,8 @@ def initialize_profiles(
     # Boundary condition: clean air enters at top
     y_gas[N_stages] = 0.0
 
-    logger.debug(f"Initialized profiles: C_liq[0]={C_liq[0]:.2f}, C_liq[{N_stages}]={C_liq[N_stages]:.2f}")
-    logger.debug(f"  y_gas[0]={y_gas[0]:.2e}, α₀={alpha_0:.3f}, H_eff={H_eff:.2f}")
+    logger.debug("Initialized profiles: C_liq[0]=%.2f, C_liq[%d]=%.2f", C_liq[0], N_stages, C_liq[N_stages])
+    logger.debug("  y_gas[0]=%.2e, α₀=%.3f, H_eff=%.2f", y_gas[0], alpha_0, H_eff)
 
     return C_liq, y_gas, pH
 
@@ -524,6 +578,17 @@ def solve_counter_current_stages(
     # Higher values = faster but may oscillate
     damping_factor = 0.3 if N_stages > 50 else 0.5
 
+    # G/L ratio for the stage mass balance (volumetric basis, for mg/L concentrations):
+    # - Air at 1 atm, 25°C: 1 L = P/(R*T) = 0.0409 mol
+    # - For A/W = 30: n_air = 30 * 0.0409 = 1.23 mol per L water
+    # - G_L_vol has units: mol_gas / L_water
+    # - This works directly with C in mg/L (no conversion to mole fraction)
+    # Constant for the whole solve, so kept out of the per-stage loop.
+    R = 0.08206  # L·atm/(mol·K)
+    T_K = temperature + 273.15
+    P_atm = 1.0  # Column operating pressure (atm)
+    G_L_vol = air_water_ratio * (P_atm / (R * T_K))  # mol_gas per L_water
+
     for iteration in range(1, max_iterations + 1):
         C_liq_old = C_liq.copy()
         y_gas_old = y_gas.copy()
@@ -550,7 +615,7 @@ def solve_counter_current_stages(
                 y_in = y_gas[i+1]
 
             # Calculate equilibrium for stage
-            logger.debug(f"Stage {i}: C_in={C_in:.3f} mg/L, y_in={y_in:.6e}")
+            logger.debug("Stage %d: C_in=%.3f mg/L, y_in=%.6e", i, C_in, y_in)
             C_eq, y_eq, pH_eq = equilibrium_stage(
                 pp, C_in, y_in, pH[i],
                 temperature, gas_phase_name, aqueous_species_name, MW,
@@ -567,16 +632,7 @@ def solve_counter_current_stages(
             # This ensures mass conservation and correct physics.
             # Stage mass balance: L*C_in + G*y_in = L*C_out + G*y_out
             # Rearranging: C_out = C_in + (G/L)*(y_in - y_out)*MW*1000
-            #
-            # G/L ratio calculation (volumetric basis, for mg/L concentrations):
-            # - Air at 1 atm, 25°C: 1 L = P/(R*T) = 0.0409 mol
-            # - For A/W = 30: n_air = 30 * 0.0409 = 1.23 mol per L water
-            # - G_L_vol has units: mol_gas / L_water
-            # - This works directly with C in mg/L (no conversion to mole fraction)
-            R = 0.08206  # L·atm/(mol·K)
-            T_K = temperature + 273.15
-            P_atm = 1.0  # Column operating pressure (atm)
-            G_L_vol = air_water_ratio * (P_atm / (R * T_K))  # mol_gas per L_water
+            # (G_L_vol is computed once, before the iteration loop)
 
             # Mass balance: compute liquid concentration change from gas uptake
             # delta_y = y_in - y_out (negative for stripping, gas gains contaminant)
@@ -593,8 +649,8 @@ def solve_counter_current_stages(
             # pH changes proportionally with Murphree efficiency
             pH_out = pH[i] + murphree_efficiency * (pH_eq - pH[i])
 
-            logger.debug(f"Stage {i}: C_out={C_out:.3f} mg/L (eq={C_eq:.3f}), "
-                        f"y_out={y_out:.6e} (eq={y_eq:.6e}), pH={pH_out:.2f}")
+            logger.debug("Stage %d: C_out=%.3f mg/L (eq=%.3f), y_out=%.6e (eq=%.6e), pH=%.2f",
+                         i, C_out, C_eq, y_out, y_eq, pH_out)
 
             # Store new values (will apply damping after all stages)
             C_liq_new[i] = C_out
@@ -613,7 +669,7 @@ def solve_counter_current_stages(
         error_y = np.max(np.abs(y_gas - y_gas_old) / (y_gas_old + absolute_tolerance))
         max_error = max(error_C, error_y)
 
-        logger.debug(f"  Iteration {iteration}: error_C={error_C:.4f}, error_y={error_y:.4f}")
+        logger.debug("  Iteration %d: error_C=%.4f, error_y=%.4f", iteration, error_C, error_y)
 
         if max_error < convergence_tolerance:
             converged = True
@@ -748,6 +804,7 @@ def find_required_stages(
     target_outlet_mg_L: float,
     N_min: int = 5,
     N_max: int = 100,
+    N_guess: Optional[int] = None,
     **kwargs
 ) -> Tuple[int, Dict]:
     """
@@ -756,8 +813,11 @@ def find_required_stages(
     This is the OUTER loop that wraps the inner counter-current convergence.
     Uses bisection to find N_stages such that C_liq[N] = target_outlet_mg_L.
 
-    Algorithm guaranteed to converge in log2(N_max - N_min) iterations,
-    typically ~7 iterations for range [5, 100].
+    Solve cost grows with N, so the upper bracket is found adaptively:
+    N_min is checked first, then N_guess (e.g. from the Tier 1 height),
+    doubling up to N_max until the target is met. Bisection then converges
+    in log2(bracket width) iterations. Without N_guess the bracket is
+    [N_min, N_max] (~7 iterations for [5, 100]).
 
     Args:
         pp: PhreeqPython instance
@@ -765,6 +825,8 @@ def find_required_stages(
         target_outlet_mg_L: Desired outlet concentration
         N_min: Minimum stages to consider (default 5)
         N_max: Maximum stages to consider (default 100)
+        N_guess: Expected stage count, used as the first upper bracket
+            (default None: start at N_max)
         **kwargs: Additional arguments passed to solve_counter_current_stages()
 
     Returns:
@@ -773,26 +835,39 @@ def find_required_stages(
     Raises:
         ValueError: If bisection bounds don't bracket the solution
     """
+    # Each counter-current solve is a full PHREEQC equilibration of every
+    # stage, so keep the profiles per N: the final N is always one the
+    # bracketing or bisection has already solved.
+    solved: Dict[int, Dict] = {}
+
+    def solve(N_stages: int) -> Dict:
+        if N_stages not in solved:
+            solved[N_stages] = solve_counter_current_stages(pp, outcome, N_stages, **kwargs)
+        return solved[N_stages]
+
     def objective(N_stages: int) -> float:
         """Return: actual_outlet - target_outlet (positive = need more stages)"""
-        profiles = solve_counter_current_stages(pp, outcome, N_stages, **kwargs)
-        actual_outlet = profiles['C_liq'][-1]  # Top of column
+        actual_outlet = solve(N_stages)['C_liq'][-1]  # Top of column
         return actual_outlet - target_outlet_mg_L
 
-    # Validate bounds
-    error_low = objective(N_min)
-    error_high = objective(N_max)
-
-    if error_low < 0:
+    # Validate lower bound before paying for any larger column
+    if objective(N_min) < 0:
         logger.warning(f"N_min={N_min} already exceeds target. Using N_min.")
-        return N_min, solve_counter_current_stages(pp, outcome, N_min, **kwargs)
-
-    if error_high > 0:
-        raise ValueError(
-            f"N_max={N_max} insufficient to reach target outlet "
-            f"(achieves {objective(N_max) + target_outlet_mg_L:.2f} mg/L, "
-            f"target {target_outlet_mg_L:.2f} mg/L). Increase N_max."
-        )
+        return N_min, solve(N_min)
+
+    # Bracket the target from above, starting at the estimate
+    N_high = N_max if N_guess is None else min(max(N_guess, N_min + 1), N_max)
+    error_high = objective(N_high)
+    while error_high > 0:
+        if N_high >= N_max:
+            raise ValueError(
+                f"N_max={N_max} insufficient to reach target outlet "
+                f"(achieves {error_high + target_outlet_mg_L:.2f} mg/L, "
+                f"target {target_outlet_mg_L:.2f} mg/L). Increase N_max."
+            )
+        N_min, N_high = N_high, min(2 * N_high, N_max)
+        error_high = objective(N_high)
+    N_max = N_high
 
     # Bisection
     logger.info(f"Bisection search for optimal stages in [{N_min}, {N_max}]")
@@ -803,16 +878,17 @@ def find_required_stages(
         N_mid = (N_min + N_max) // 2
         error_mid = objective(N_mid)
 
-        logger.debug(f"  Bisection iter {iteration}: N={N_mid}, error={error_mid:.3f} mg/L")
+        logger.debug("  Bisection iter %d: N=%d, error=%.3f mg/L", iteration, N_mid, error_mid)
 
         if error_mid > 0:  # Not enough removal, need more stages
             N_min = N_mid
         else:  # Too much removal, can use fewer stages
             N_max = N_mid
 
-    # Return conservative choice (N_max ensures target is met)
+    # Return conservative choice (N_max ensures target is met); N_max is
+    # always a stage count the search has already solved.
     optimal_N = N_max
-    final_profiles = solve_counter_current_stages(pp, outcome, optimal_N, **kwargs)
+    final_profiles = solve(optimal_N)
 
     logger.info(f"Optimal stages: N={optimal_N} (found in {iteration} bisection iterations)")
 
@@ -823,6 +899,24 @@ def find_required_stages(
 # PACKED HEIGHT CALCULATION (HETP METHOD)
 # ============================================================================
 
+# For pH-coupled stripping, apply safety factor
+# Bottom stages have lower efficiency due to reduced α₀
+HETP_SAFETY_FACTOR = 1.2
+
+
+def estimate_stage_count(outcome: Tier1Outcome) -> Optional[int]:
+    """
+    Estimate theoretical stages from the Tier 1 packed height.
+
+    Inverts calculate_packed_height() (N = height / HETP); used to start
+    the stage search near the answer. Returns None without a Tier 1 HTU.
+    """
+    HTU_m = getattr(outcome.result, 'htu_m', None)
+    if not HTU_m:
+        return None
+    return math.ceil(outcome.result.packing_height_m / (HTU_m * HETP_SAFETY_FACTOR))
+
+
 def calculate_packed_height(
     N_theoretical_stages: int,
     outcome: Tier1Outcome
@@ -866,11 +960,7 @@ def calculate_packed_height(
 
         logger.warning(f"HTU not in tier1_results, using estimated HTU={HTU_m:.2f} m")
 
-    # For pH-coupled stripping, apply safety factor
-    # Bottom stages have lower efficiency due to reduced α₀
-    safety_factor = 1.2
-
-    HETP_m = HTU_m * safety_factor
+    HETP_m = HTU_m * HETP_SAFETY_FACTOR
 
     packed_height_m = N_theoretical_stages * HETP_m
 
@@ -892,7 +982,8 @@ def staged_column_simulation(
     find_optimal_stages: bool = True,
     convergence_tolerance: float = 0.02,  # 2% tolerance (updated to match plan)
     max_inner_iterations: int = 200,  # Increased for complex pH-coupled systems
-    validate_mass_balance_flag: bool = True
+    validate_mass_balance_flag: bool = True,
+    pp: Optional['PhreeqPython'] = None
 ) -> Dict:
     """
     Rigorous staged column simulation with pH-coupled speciation.
@@ -902,7 +993,7 @@ def staged_column_simulation(
     height using HETP from Tier 1.
 
     Workflow:
-        1. Get cached PhreeqPython instance
+        1. Borrow a pooled PhreeqPython instance (unless one is passed)
         2. Either:
            a) Find optimal N_stages via bisection (if find_optimal_stages=True)
            b) Use provided num_stages_initial
@@ -919,6 +1010,8 @@ def staged_column_simulation(
         convergence_tolerance: Profile convergence tolerance (default: 1%)
         max_inner_iterations: Max iterations for profile convergence (default: 50)
         validate_mass_balance_flag: Check mass balance closure (default: True)
+        pp: PhreeqPython instance to use (default: borrow one from the pool
+            for the duration of the call)
 
     Returns:
         Dict with keys:
@@ -943,8 +1036,18 @@ def staged_column_simulation(
     """
     # No validation needed - Tier1Outcome is already validated by Pydantic
 
-    # Get cached PhreeqPython instance
-    pp = get_phreeqc_instance()
+    # Borrow a warm PhreeqPython instance for the whole simulation
+    if pp is None:
+        with acquire_phreeqc_instance() as pp:
+            return staged_column_simulation(
+                outcome,
+                num_stages_initial=num_stages_initial,
+                find_optimal_stages=find_optimal_stages,
+                convergence_tolerance=convergence_tolerance,
+                max_inner_iterations=max_inner_iterations,
+                validate_mass_balance_flag=validate_mass_balance_flag,
+                pp=pp
+            )
 
     # Find optimal stages or use provided
     if find_optimal_stages:
@@ -954,6 +1057,7 @@ def staged_column_simulation(
         target_outlet = outcome.request.outlet_concentration_mg_L
         N_optimal, profiles = find_required_stages(
             pp, outcome, target_outlet,
+            N_guess=estimate_stage_count(outcome),
             convergence_tolerance=convergence_tolerance,
             max_iterations=max_inner_iterations
         )
@@ -14,6 +14,7 @@ Author: Claude AI
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
@@ -30,28 +31,50 @@ _IDAES_LOADED = False
 logger = logging.getLogger(__name__)
 
 
+# Held while loading, so a costing job and the server's background preload
+# never import or register the currency units twice
+_load_lock = threading.Lock()
+
+
 def _ensure_pyomo_loaded():
     """Lazy-load Pyomo and IDAES libraries only when needed."""
     global _PYOMO_LOADED, _IDAES_LOADED, ConcreteModel, Block, pyunits, register_idaes_currency_units
 
-    if not _PYOMO_LOADED:
-        logger.debug("Loading Pyomo libraries (lazy import)...")
-        from pyomo.environ import ConcreteModel as _ConcreteModel, Block as _Block, units as _pyunits
-        ConcreteModel = _ConcreteModel
-        Block = _Block
-        pyunits = _pyunits
-        _PYOMO_LOADED = True
-
-    if not _IDAES_LOADED:
-        logger.debug("Loading IDAES libraries (lazy import)...")
-        from idaes.core.base.costing_base import register_idaes_currency_units as _register
-        register_idaes_currency_units = _register
-        register_idaes_currency_units()
-        _IDAES_LOADED = True
+    if _PYOMO_LOADED and _IDAES_LOADED:
+        return ConcreteModel, Block, pyunits
+
+    with _load_lock:
+        if not _PYOMO_LOADED:
+            logger.debug("Loading Pyomo libraries (lazy import)...")
+            from pyomo.environ import ConcreteModel as _ConcreteModel, Block as _Block, units as _pyunits
+            ConcreteModel = _ConcreteModel
+            Block = _Block
+            pyunits = _pyunits
+            _PYOMO_LOADED = True
+
+        if not _IDAES_LOADED:
+            logger.debug("Loading IDAES libraries (lazy import)...")
+            from idaes.core.base.costing_base import register_idaes_currency_units as _register
+            register_idaes_currency_units = _register
+            register_idaes_currency_units()
+            _IDAES_LOADED = True
 
     return ConcreteModel, Block, pyunits
 
 
+def preload_costing_libraries() -> None:
+    """
+    Import Pyomo/IDAES and the degasser costing methods ahead of time.
+
+    None of these imports depend on the design inputs, so callers can run
+    this in a worker thread (e.g. ``asyncio.to_thread``) while Tier 1 sizing
+    is still in progress and hide most of the import latency.
+    """
+    _ensure_pyomo_loaded()
+    import utils.degasser_costing_methods  # noqa: F401  (pulls in WaterTAP)
+    import utils.costing_parameters  # noqa: F401
+
+
 @dataclass
 class DegasserCostingResult:
     """
@@ -115,6 +138,26 @@ class MockCostingPackage:
         self.tower_internals = m.tower_internals
 
 
+_costing_package = None
+_costing_package_lock = threading.Lock()
+
+
+def get_costing_package() -> MockCostingPackage:
+    """
+    Return the process-wide costing parameter package.
+
+    The parameter blocks are identical for every costing call (only the
+    unit-model Expressions change), so they are built once and shared by
+    all Tier 3 jobs running in this process.
+    """
+    global _costing_package
+    if _costing_package is None:
+        with _costing_package_lock:
+            if _costing_package is None:
+                _costing_package = MockCostingPackage()
+    return _costing_package
+
+
 def calculate_economic_metrics(
     total_capex: float,
     total_annual_opex: float,
@@ -276,8 +319,8 @@ def cost_degasser_system(
     m = ConcreteModel()
     m.fs = Block()
 
-    # Create mock costing package
-    m.fs.costing = MockCostingPackage()
+    # Shared mock costing package (parameter blocks built once per process)
+    m.fs.costing = get_costing_package()
 
     # Create unit blocks for each equipment piece
     m.fs.blower = Block()
@@ -14,16 +14,38 @@ Reference: henrys-law.org, makingglitches/Henryslaw SQLite database
 
 import sqlite3
 import logging
+import threading
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 import math
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Database path
 DB_DIR = Path(__file__).parent.parent / "databases"
 HENRYS_DB = DB_DIR / "henrys_law.db"
 
+# One read-only connection for all lookups, shared across threads (Tier 2
+# jobs run on worker threads); the lock keeps each query's statements together
+_henrys_conn: Optional[sqlite3.Connection] = None
+_henrys_lock = threading.Lock()
+
+
+def _get_henrys_connection() -> sqlite3.Connection:
+    """Open henrys_law.db read-only on first use (memory-mapped) and reuse it."""
+    global _henrys_conn
+    if _henrys_conn is None:
+        conn = sqlite3.connect(
+            f"file:{HENRYS_DB.as_posix()}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute("PRAGMA query_only=1;")
+        conn.execute("PRAGMA mmap_size=67108864;")
+        _henrys_conn = conn
+    return _henrys_conn
+
 
 def get_database_schema() -> Dict[str, Any]:
     """
@@ -35,9 +57,11 @@ def get_database_schema() -> Dict[str, Any]:
         logger.error(f"Henry's law database not found: {HENRYS_DB}")
         return {}
 
-    conn = sqlite3.connect(HENRYS_DB)
-    cursor = conn.cursor()
+    with _henrys_lock:
+        return _read_database_schema(_get_henrys_connection().cursor())
+
 
+def _read_database_schema(cursor: sqlite3.Cursor) -> Dict[str, Any]:
     schema = {}
 
     # Get all tables
@@ -54,8 +78,6 @@ def get_database_schema() -> Dict[str, Any]:
             'column_names': [col[1] for col in columns]
         }
 
-    conn.close()
-
     return schema
 
 
@@ -91,9 +113,17 @@ def query_henry_by_cas(
         logger.error(f"Henry's law database not found: {HENRYS_DB}")
         return None
 
-    conn = sqlite3.connect(HENRYS_DB)
-    cursor = conn.cursor()
+    with _henrys_lock:
+        return _query_henry_by_cas(
+            _get_henrys_connection().cursor(), cas_number, henry_type
+        )
 
+
+def _query_henry_by_cas(
+    cursor: sqlite3.Cursor,
+    cas_number: str,
+    henry_type: str
+) -> Optional[Dict[str, Any]]:
     try:
         # First, check schema for available columns
         # Following Codex: look for numeric columns (Hcc, dHcc, etc.)
@@ -178,7 +208,7 @@ def query_henry_by_cas(
         return None
 
     finally:
-        conn.close()
+        cursor.close()
 
 
 def calculate_henry_at_temperature(
@@ -210,6 +240,55 @@ def calculate_henry_at_temperature(
     return H_target
 
 
+@lru_cache(maxsize=1)
+def _read_voc_properties() -> Optional[Dict[str, Any]]:
+    """Parse voc_properties.json once per process; None if it is missing."""
+    voc_props_file = DB_DIR / "voc_properties.json"
+    if not voc_props_file.exists():
+        return None
+    return orjson.loads(voc_props_file.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _voc_index() -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """
+    Map each CAS number and upper-cased common name to its (cas, props) entry.
+
+    Built once so lookups skip the linear scan over voc_properties.json.
+    Entries without a 25°C Henry's constant are left out (they were never
+    usable; see _voc_keys_without_henry()); the first compound listing a
+    name wins, as in the old scan.
+    """
+    index: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for cas, props in (_read_voc_properties() or {}).items():
+        if props.get('henry_constant_25C') is None:
+            logger.debug("Skipping %s in VOC index: no Henry's constant", cas)
+            continue
+        for key in [cas] + props.get('common_names', []):
+            index.setdefault(key.upper(), (cas, props))
+    return index
+
+
+@lru_cache(maxsize=1)
+def _voc_keys_without_henry() -> frozenset:
+    """Upper-cased CAS numbers and common names of VOC entries lacking a 25°C Henry's constant."""
+    return frozenset(
+        key.upper()
+        for cas, props in (_read_voc_properties() or {}).items()
+        if props.get('henry_constant_25C') is None
+        for key in [cas] + props.get('common_names', [])
+    )
+
+
+@lru_cache(maxsize=1024)
+def _voc_henry_at_temperature(cas: str, temperature_c: float) -> float:
+    """Van't Hoff-corrected Henry's constant for a voc_properties.json entry, memoized per (CAS, T)."""
+    props = _voc_index()[cas.upper()][1]
+    return calculate_henry_at_temperature(
+        props['henry_constant_25C'], 298.15, temperature_c + 273.15, props['henry_enthalpy']
+    )
+
+
 def get_voc_henry_constant(
     compound_name: str,
     temperature_c: float = 25.0
@@ -224,47 +303,35 @@ def get_voc_henry_constant(
     Returns:
         Dict with Henry's constant and metadata, or None if not found
     """
-    import json
-
     # First, check voc_properties.json
-    voc_props_file = DB_DIR / "voc_properties.json"
-
-    if voc_props_file.exists():
-        with open(voc_props_file, 'r') as f:
-            voc_db = json.load(f)
-
-        # Search by CAS or by common name
-        for cas, props in voc_db.items():
-            if (compound_name == cas or
-                compound_name.upper() in [n.upper() for n in props.get('common_names', [])]):
-
-                # Found in VOC database
-                H_25C = props.get('henry_constant_25C')
-                delta_H = props.get('henry_enthalpy')
-
-                if H_25C is None:
-                    logger.warning(f"No Henry's constant for {compound_name} in VOC database")
-                    continue
-
-                # Calculate at target temperature if enthalpy available
-                if delta_H and temperature_c != 25.0:
-                    T_ref = 298.15  # 25°C
-                    T_target = temperature_c + 273.15
-                    H_target = calculate_henry_at_temperature(H_25C, T_ref, T_target, delta_H)
-                else:
-                    H_target = H_25C
-
-                return {
-                    'cas_number': cas,
-                    'name': props.get('name'),
-                    'formula': props.get('formula'),
-                    'henry_constant': H_target,
-                    'henry_constant_25C': H_25C,
-                    'henry_enthalpy': delta_H,
-                    'temperature': temperature_c,
-                    'henry_type': 'cc',  # dimensionless Cgas/Caq
-                    'source': 'voc_properties.json'
-                }
+    key = compound_name.upper()
+    match = _voc_index().get(key)
+    if match is None and key in _voc_keys_without_henry():
+        logger.warning(f"No Henry's constant for {compound_name} in VOC database")
+    if match is not None:
+        cas, props = match
+
+        # Found in VOC database
+        H_25C = props['henry_constant_25C']
+        delta_H = props.get('henry_enthalpy')
+
+        # Calculate at target temperature if enthalpy available
+        if delta_H and temperature_c != 25.0:
+            H_target = _voc_henry_at_temperature(cas, temperature_c)
+        else:
+            H_target = H_25C
+
+        return {
+            'cas_number': cas,
+            'name': props.get('name'),
+            'formula': props.get('formula'),
+            'henry_constant': H_target,
+            'henry_constant_25C': H_25C,
+            'henry_enthalpy': delta_H,
+            'temperature': temperature_c,
+            'henry_type': 'cc',  # dimensionless Cgas/Caq
+            'source': 'voc_properties.json'
+        }
 
     # If not found in VOC database, try henrys_law.db
     # Assume compound_name might be a CAS number
@@ -10,6 +10,23 @@ modifications should be kept minimal and documented below.
 
 DEGASSER-SPECIFIC MODIFICATIONS:
 - Updated result file patterns to include tier2_results.json, tier3_results.json
+- Job subprocesses get stdin=DEVNULL so they never inherit the MCP server's
+  STDIO pipe (a child reading it can stall or corrupt the JSON-RPC stream)
+- Monitor tasks are kept per job so wait_for_completion() can await job
+  completion directly instead of polling get_status()
+- execute_async() runs a job's coroutine in-process on a worker thread (own
+  event loop) so Tier 2/3 reuse the server's already-imported modules;
+  execute() remains for subprocess isolation
+- job.json, progress.json and result files are read with orjson straight
+  from bytes (no text-mode decode before parsing)
+- job.json is written with orjson under a lock; _save_job_metadata_async()
+  does the write on a worker thread for callers on the request path
+- In-process jobs get their own stdout.log/stderr.log: sys.stdout/sys.stderr
+  are wrapped once so writes from a job's worker thread go to its job
+  directory instead of the server's STDIO stream
+- execute_async() takes an optional serial_key; in-process jobs sharing a
+  key run one at a time (e.g. Tier 3 Pyomo model building)
+- get_results() only lists stdout/stderr log files that exist
 
 Implements the Background Job Pattern to avoid MCP STDIO blocking issues
 with heavy Python imports (Pyomo, IDAES, PHREEQC).
@@ -33,21 +50,75 @@ Architecture:
 """
 
 import asyncio
-import json
 import logging
 import os
+import orjson
 import psutil
 import signal
+import sys
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Awaitable, Callable, Optional, Dict, List
 
 from utils.path_utils import normalize_path_for_wsl
 
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path):
+    """Parse a JSON file from its raw bytes."""
+    return orjson.loads(path.read_bytes())
+
+
+class _ThreadRoutedStream:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes made on an in-process
+    job's worker thread to that job's log file.
+
+    Writes from any other thread (and every other attribute, e.g. ``buffer``)
+    go to the wrapped stream, so the MCP STDIO transport is unaffected.
+    Output written straight to the process file descriptors by native code
+    is not captured; run jobs as subprocesses where that matters.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "file", None) or self._fallback
+
+    def set_thread_target(self, file) -> None:
+        self._local.file = file
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def writelines(self, lines):
+        return self._target().writelines(lines)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._fallback, name)
+
+
+_stream_install_lock = threading.Lock()
+
+
+def _routed_stream(name: str) -> _ThreadRoutedStream:
+    """Wrap sys.<name> in a _ThreadRoutedStream (once) and return the wrapper."""
+    with _stream_install_lock:
+        stream = getattr(sys, name)
+        if not isinstance(stream, _ThreadRoutedStream):
+            stream = _ThreadRoutedStream(stream)
+            setattr(sys, name, stream)
+        return stream
+
+
 class JobManager:
     """
     Singleton job manager with crash recovery and concurrency control.
@@ -89,10 +160,15 @@ class JobManager:
             return
 
         self.jobs: Dict[str, dict] = {}
+        self._monitor_tasks: Dict[str, asyncio.Task] = {}
+        # job.json may be written from the loop and from worker threads
+        self._metadata_lock = threading.Lock()
         self.jobs_dir = Path(jobs_base_dir)
         self.jobs_dir.mkdir(exist_ok=True)
         self.semaphore = asyncio.Semaphore(max_concurrent_jobs)
         self.max_concurrent_jobs = max_concurrent_jobs
+        # execute_async(serial_key=...) -> lock held while that job runs
+        self._serial_locks: Dict[str, asyncio.Lock] = {}
 
         # Load existing jobs from disk (crash recovery)
         self._load_existing_jobs()
@@ -112,8 +188,7 @@ class JobManager:
 
         for job_file in self.jobs_dir.glob("*/job.json"):
             try:
-                with open(job_file) as f:
-                    job = json.load(f)
+                job = _read_json(job_file)
 
                 job_id = job.get("id")
                 if not job_id:
@@ -228,6 +303,7 @@ class JobManager:
                 proc = await asyncio.create_subprocess_exec(
                     *cmd_normalized,
                     cwd=cwd_normalized,
+                    stdin=asyncio.subprocess.DEVNULL,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                     env=proc_env
@@ -242,8 +318,11 @@ class JobManager:
 
                 logger.info(f"Job {job_id} started with PID {proc.pid}")
 
-                # Monitor in background (fire and forget - don't await!)
-                asyncio.create_task(self._monitor_job(job_id, proc))
+                # Monitor in background (don't await!); the task doubles as
+                # the completion handle for wait_for_completion()
+                task = asyncio.create_task(self._monitor_job(job_id, proc))
+                self._monitor_tasks[job_id] = task
+                task.add_done_callback(lambda _t, jid=job_id: self._monitor_tasks.pop(jid, None))
 
             except Exception as e:
                 job["status"] = "failed"
@@ -254,6 +333,130 @@ class JobManager:
 
         return job
 
+    async def execute_async(self, runner: Callable[..., Awaitable[int]], *args, job_id: Optional[str] = None,
+                            serial_key: Optional[str] = None, **kwargs) -> dict:
+        """
+        Execute a job coroutine in-process instead of spawning a subprocess.
+
+        ``runner(*args, **kwargs)`` must be a coroutine function returning an exit code
+        (0 = success) that writes its own results into the job directory,
+        e.g. ``utils.tier3_cli.run_tier3_costing(job_dir)``. It runs on a worker
+        thread with its own event loop, so CPU-bound work does not block the
+        MCP server loop, while heavy imports stay resident across jobs.
+        Python-level output from that thread goes to the job's stdout.log and
+        stderr.log.
+
+        Args:
+            runner: Coroutine function to run
+            *args: Positional arguments for runner (recorded as the job command)
+            job_id: Optional pre-determined job ID (directory must exist)
+            serial_key: Optional key; jobs sharing it run one at a time, for
+                runners whose libraries are not safe to drive from several threads
+            **kwargs: Keyword arguments for runner (not recorded)
+
+        Returns:
+            Job metadata dict with job_id, status, command, etc.
+        """
+        if job_id is None:
+            job_id = str(uuid.uuid4())[:8]
+            job_dir = self.jobs_dir / job_id
+            job_dir.mkdir(exist_ok=True)
+        else:
+            job_dir = self.jobs_dir / job_id
+            if job_id in self.jobs:
+                raise ValueError(f"Job ID {job_id} already exists in active jobs")
+            if not job_dir.exists():
+                raise ValueError(f"Job directory {job_dir} must exist when providing custom job_id")
+
+        job = {
+            "id": job_id,
+            "command": [f"{runner.__module__}.{runner.__qualname__}", *map(str, args)],
+            "cwd": str(Path.cwd()),
+            "status": "running",
+            "started_at": time.time(),
+            "job_dir": str(job_dir.absolute()),
+            "env": {},
+            "in_process": True
+        }
+        self.jobs[job_id] = job
+        self._save_job_metadata(job)
+
+        logger.info(f"Starting in-process job {job_id}: {job['command'][0]}")
+
+        task = asyncio.create_task(self._run_in_process(job_id, runner(*args, **kwargs), serial_key))
+        self._monitor_tasks[job_id] = task
+        task.add_done_callback(lambda _t, jid=job_id: self._monitor_tasks.pop(jid, None))
+
+        return job
+
+    @staticmethod
+    def _run_with_job_logs(job_dir: Path, coro: Awaitable[int]) -> int:
+        """Run coro to completion on this thread, with its output in the job logs."""
+        stdout, stderr = _routed_stream("stdout"), _routed_stream("stderr")
+        with open(job_dir / "stdout.log", "w") as out, open(job_dir / "stderr.log", "w") as err:
+            stdout.set_thread_target(out)
+            stderr.set_thread_target(err)
+            try:
+                return asyncio.run(coro)
+            finally:
+                stdout.set_thread_target(None)
+                stderr.set_thread_target(None)
+
+    async def _run_in_process(self, job_id: str, coro: Awaitable[int], serial_key: Optional[str] = None):
+        """Run an in-process job under the concurrency semaphore and record its outcome."""
+        job = self.jobs[job_id]
+        serial_lock = self._serial_locks.setdefault(serial_key, asyncio.Lock()) if serial_key else None
+
+        try:
+            # Wait for the serial lock first so a queued job holds no semaphore slot
+            if serial_lock is not None:
+                await serial_lock.acquire()
+            try:
+                async with self.semaphore:
+                    exit_code = await asyncio.to_thread(self._run_with_job_logs, Path(job["job_dir"]), coro)
+            finally:
+                if serial_lock is not None:
+                    serial_lock.release()
+
+            job["status"] = "completed" if exit_code == 0 else "failed"
+            job["exit_code"] = exit_code
+            job["completed_at"] = time.time()
+
+            if exit_code != 0:
+                job["error"] = self._read_result_error(Path(job["job_dir"])) or f"Job exited with code {exit_code}"
+
+            logger.info(f"Job {job_id} {job['status']} with exit code {exit_code}")
+
+            # Apply state patch if job completed successfully
+            if job["status"] == "completed" and "state_patch" in job:
+                from utils.job_state_reconciler import JobStateReconciler
+                reconciler = JobStateReconciler()
+                if reconciler.apply(job):
+                    job["state_applied"] = True
+                    logger.info(f"State patch applied for job {job_id}")
+
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = f"In-process job error: {str(e)}"
+            job["completed_at"] = time.time()
+            logger.error(f"Job {job_id} failed: {e}")
+
+        finally:
+            self._save_job_metadata(job)
+
+    def _read_result_error(self, job_dir: Path) -> Optional[str]:
+        """Return the error message an in-process runner wrote to its result file, if any."""
+        for filename in ("tier2_results.json", "tier3_results.json", "results.json"):
+            result_path = job_dir / filename
+            if result_path.exists():
+                try:
+                    data = _read_json(result_path)
+                    if isinstance(data, dict) and data.get("status") == "error":
+                        return str(data.get("message", ""))[:500]
+                except Exception:
+                    pass
+        return None
+
     async def _monitor_job(self, job_id: str, proc: asyncio.subprocess.Process):
         """
         Monitor job completion and capture output.
@@ -309,17 +512,42 @@ class JobManager:
             # Save final metadata
             self._save_job_metadata(job)
 
+    async def wait_for_completion(self, job_id: str, timeout: float) -> bool:
+        """
+        Wait until a job started by this process finishes.
+
+        Awaits the job's monitor task, so the caller wakes as soon as final
+        metadata is written. Returns False if the timeout expires or there
+        is no completion handle (job unknown, already finished, or
+        recovered from disk) - callers should then fall back to get_status().
+        """
+        task = self._monitor_tasks.get(job_id)
+        if task is None:
+            return False
+        try:
+            # shield: a timeout must not cancel the monitor itself
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     def _save_job_metadata(self, job: dict):
         """Save job metadata to disk."""
         job_dir = Path(job["job_dir"])
         metadata_file = job_dir / "job.json"
 
         try:
-            with open(metadata_file, "w") as f:
-                json.dump(job, f, indent=2)
+            # Serialize at write time under the lock so the last write always
+            # carries the job's latest state, whichever thread performs it
+            with self._metadata_lock:
+                metadata_file.write_bytes(orjson.dumps(job, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Failed to save metadata for job {job['id']}: {e}")
 
+    async def _save_job_metadata_async(self, job: dict):
+        """Save job metadata to disk without blocking the event loop."""
+        await asyncio.to_thread(self._save_job_metadata, job)
+
     async def get_status(self, job_id: str) -> dict:
         """
         Get job status with progress hints.
@@ -393,8 +621,7 @@ class JobManager:
         progress_file = job_path / "progress.json"
         if progress_file.exists():
             try:
-                with open(progress_file, "r") as f:
-                    data = json.load(f)
+                data = _read_json(progress_file)
                 return {
                     "percent": data.get("current", 0),
                     "total": data.get("total", 100),
@@ -478,8 +705,7 @@ class JobManager:
             result_path = job_dir / filename
             if result_path.exists():
                 try:
-                    with open(result_path) as f:
-                        results = json.load(f)
+                    results = _read_json(result_path)
                     result_file_found = str(result_path)
                     break
                 except Exception as e:
@@ -488,10 +714,12 @@ class JobManager:
         response = {
             "job_id": job_id,
             "status": "completed",
-            "total_time_seconds": round(job.get("completed_at", time.time()) - job["started_at"], 1),
-            "stdout_file": str(job_dir / "stdout.log"),
-            "stderr_file": str(job_dir / "stderr.log")
+            "total_time_seconds": round(job.get("completed_at", time.time()) - job["started_at"], 1)
         }
+        for stream in ("stdout", "stderr"):
+            log_path = job_dir / f"{stream}.log"
+            if log_path.exists():
+                response[f"{stream}_file"] = str(log_path)
 
         if results:
             response["results"] = results
@@ -555,6 +783,9 @@ class JobManager:
         if job["status"] != "running":
             return {"error": f"Job {job_id} is not running (status: {job['status']})"}
 
+        if job.get("in_process"):
+            return {"error": f"Job {job_id} runs in-process and cannot be terminated; wait for it to finish"}
+
         pid = job.get("pid")
         if not pid:
             return {"error": f"Job {job_id} has no PID recorded"}
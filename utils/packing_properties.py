@@ -11,11 +11,13 @@ Reference:
 - pack.json database with 9 standard packings
 """
 
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Database path
@@ -41,12 +43,18 @@ def load_packing_catalog() -> Dict[str, Dict[str, Any]]:
             ...
         }
     """
+    # Entries are flat dicts; copy them so callers never alter the cached catalog
+    return {packing_id: dict(props) for packing_id, props in _read_packing_catalog().items()}
+
+
+@lru_cache(maxsize=1)
+def _read_packing_catalog() -> Dict[str, Dict[str, Any]]:
+    """Parse pack.json once per process (the catalog is static)."""
     if not PACK_JSON.exists():
         logger.error(f"Packing catalog not found: {PACK_JSON}")
         return {}
 
-    with open(PACK_JSON, 'r') as f:
-        catalog = json.load(f)
+    catalog = orjson.loads(PACK_JSON.read_bytes())
 
     logger.info(f"Loaded {len(catalog)} packings from pack.json")
     return catalog
@@ -17,12 +17,16 @@ Outputs:
 """
 
 import sys
-import json
 import argparse
 import asyncio
 import logging
+import math
 import time
 from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import orjson
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -50,39 +54,48 @@ def write_progress(job_dir: Path, stage: str, current: int, total: int = 100):
     """
     progress_file = job_dir / "progress.json"
     try:
-        with open(progress_file, 'w') as f:
-            json.dump({
-                "stage": stage,
-                "current": current,
-                "total": total,
-                "timestamp": time.time()
-            }, f)
+        progress_file.write_bytes(orjson.dumps({
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "timestamp": time.time()
+        }))
     except Exception as e:
         logger.warning(f"Failed to write progress: {e}")
 
 
-def convert_to_dict(obj):
-    """Recursively convert dataclasses and Pydantic models to plain dicts/lists."""
-    from pydantic import BaseModel
-    from dataclasses import fields
-
-    if isinstance(obj, BaseModel):
-        return {k: convert_to_dict(v) for k, v in obj.model_dump().items()}
-    if hasattr(obj, "__dataclass_fields__"):
-        return {field.name: convert_to_dict(getattr(obj, field.name)) for field in fields(obj)}
-    if isinstance(obj, dict):
-        return {k: convert_to_dict(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [convert_to_dict(item) for item in obj]
-    return obj
+def check_finite(value, path: str = "result"):
+    """
+    Raise ValueError if value holds NaN or Inf anywhere.
 
+    orjson writes non-finite floats as null instead of failing, so results
+    are checked first (the json.dump(allow_nan=False) guarantee).
 
-async def run_tier2_simulation(job_dir: Path):
+    Args:
+        value: Result dict (nested dicts, lists, numpy arrays, floats)
+        path: Location reported in the error message
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            check_finite(item, f"{path}.{key}")
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            check_finite(item, f"{path}[{i}]")
+    elif isinstance(value, np.ndarray):
+        if value.dtype.kind in "fc" and not np.isfinite(value).all():
+            raise ValueError(f"Non-finite values in {path}")
+    elif isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Non-finite value in {path}: {value}")
+
+
+async def run_tier2_simulation(job_dir: Path, params: Optional[dict] = None):
     """
     Run Tier 1 + Tier 2 PHREEQC simulation.
 
     Args:
         job_dir: Job directory containing params.json
+        params: Parameters already in memory (in-process jobs); params.json
+            is only read when this is omitted
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -93,14 +106,14 @@ async def run_tier2_simulation(job_dir: Path):
     params_file = job_dir / "params.json"
     output_file = job_dir / "tier2_results.json"
 
-    if not params_file.exists():
+    if params is None and not params_file.exists():
         logger.error(f"params.json not found in {job_dir}")
         return 1
 
     try:
         # Load parameters
-        with open(params_file) as f:
-            params = json.load(f)
+        if params is None:
+            params = orjson.loads(params_file.read_bytes())
 
         logger.info(f"Running Tier 2 simulation for {params.get('application', 'unknown')}")
 
@@ -130,13 +143,17 @@ async def run_tier2_simulation(job_dir: Path):
         write_progress(job_dir, "Running Tier 1 heuristic sizing", 10)
         tier1_outcome = await heuristic_sizing(**tier1_params)
 
-        # Convert Tier 1 to dict
-        tier1_dict = convert_to_dict(tier1_outcome)
+        # Convert Tier 1 to dict (shallow dumps, no recursive walk)
+        tier1_dict = tier1_outcome.to_dict()
         write_progress(job_dir, "Tier 1 complete, starting PHREEQC simulation", 25)
 
         # Run Tier 2 PHREEQC simulation
         logger.info("Running Tier 2 PHREEQC simulation...")
         write_progress(job_dir, "Running PHREEQC multi-stage simulation", 30)
+        # Called directly, not via asyncio.to_thread: this coroutine already
+        # runs off the server's event loop (a worker thread for in-process
+        # jobs, its own interpreter otherwise); the simulation borrows a warm
+        # PhreeqPython instance from the shared pool
         tier2_result = staged_column_simulation(
             tier1_outcome,
             num_stages_initial=num_stages_initial,
@@ -153,8 +170,11 @@ async def run_tier2_simulation(job_dir: Path):
         result['tier2'] = tier2_result
 
         # Write output
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2, allow_nan=False)
+        # (orjson: stage profiles are numpy arrays; NaN/Inf fail the job)
+        check_finite(result)
+        output_file.write_bytes(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         logger.info(f"Tier 2 complete: {tier2_result['theoretical_stages']} stages, "
                    f"{tier2_result['tower_height_m']:.1f}m height")
@@ -170,8 +190,7 @@ async def run_tier2_simulation(job_dir: Path):
             "message": f"Tier 2 simulation failed: {str(e)}",
             "traceback": traceback.format_exc()
         }
-        with open(output_file, 'w') as f:
-            json.dump(error_result, f, indent=2)
+        output_file.write_bytes(orjson.dumps(error_result, option=orjson.OPT_INDENT_2))
         return 1
 
 
@@ -23,6 +23,9 @@ import asyncio
 import logging
 import time
 from pathlib import Path
+from typing import Optional
+
+import orjson
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -50,39 +53,24 @@ def write_progress(job_dir: Path, stage: str, current: int, total: int = 100):
     """
     progress_file = job_dir / "progress.json"
     try:
-        with open(progress_file, 'w') as f:
-            json.dump({
-                "stage": stage,
-                "current": current,
-                "total": total,
-                "timestamp": time.time()
-            }, f)
+        progress_file.write_bytes(orjson.dumps({
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "timestamp": time.time()
+        }))
     except Exception as e:
         logger.warning(f"Failed to write progress: {e}")
 
 
-def convert_to_dict(obj):
-    """Recursively convert dataclasses and Pydantic models to plain dicts/lists."""
-    from pydantic import BaseModel
-    from dataclasses import fields
-
-    if isinstance(obj, BaseModel):
-        return {k: convert_to_dict(v) for k, v in obj.model_dump().items()}
-    if hasattr(obj, "__dataclass_fields__"):
-        return {field.name: convert_to_dict(getattr(obj, field.name)) for field in fields(obj)}
-    if isinstance(obj, dict):
-        return {k: convert_to_dict(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [convert_to_dict(item) for item in obj]
-    return obj
-
-
-async def run_tier3_costing(job_dir: Path):
+async def run_tier3_costing(job_dir: Path, params: Optional[dict] = None):
     """
     Run Tier 1 + Tier 3 WaterTAP economic costing.
 
     Args:
         job_dir: Job directory containing params.json
+        params: Parameters already in memory (in-process jobs); params.json
+            is only read when this is omitted
 
     Returns:
         Exit code (0 for success, 1 for error)
@@ -93,14 +81,14 @@ async def run_tier3_costing(job_dir: Path):
     params_file = job_dir / "params.json"
     output_file = job_dir / "tier3_results.json"
 
-    if not params_file.exists():
+    if params is None and not params_file.exists():
         logger.error(f"params.json not found in {job_dir}")
         return 1
 
     try:
         # Load parameters
-        with open(params_file) as f:
-            params = json.load(f)
+        if params is None:
+            params = orjson.loads(params_file.read_bytes())
 
         logger.info(f"Running Tier 3 costing for {params.get('application', 'unknown')}")
         write_progress(job_dir, "Loading WaterTAP/Pyomo (this takes ~10-20 seconds first time)", 5)
@@ -130,8 +118,8 @@ async def run_tier3_costing(job_dir: Path):
         write_progress(job_dir, "Running Tier 1 heuristic sizing", 20)
         tier1_outcome = await heuristic_sizing(**tier1_params)
 
-        # Convert Tier 1 to dict
-        tier1_dict = convert_to_dict(tier1_outcome)
+        # Convert Tier 1 to dict (shallow dumps, no recursive walk)
+        tier1_dict = tier1_outcome.to_dict()
         write_progress(job_dir, "Tier 1 complete, starting WaterTAP costing", 35)
 
         # Run Tier 3 WaterTAP costing
@@ -148,9 +136,9 @@ async def run_tier3_costing(job_dir: Path):
 
         # Combine results
         result = tier1_dict
-        result['tier3'] = convert_to_dict(tier3_result)
+        result['tier3'] = tier3_result  # already a plain dict (asdict)
 
-        # Write output
+        # Write output (json, not orjson: allow_nan=False fails the job on NaN/Inf)
         with open(output_file, 'w') as f:
             json.dump(result, f, indent=2, allow_nan=False)
 
@@ -171,6 +159,7 @@ async def run_tier3_costing(job_dir: Path):
             "message": f"Tier 3 costing failed: {str(e)}",
             "traceback": traceback.format_exc()
         }
+        # Result files use json throughout (allow_nan=False on success)
         with open(output_file, 'w') as f:
             json.dump(error_result, f, indent=2)
         return 1